@@ -5,6 +5,8 @@
 题目：有四个数字：1、2、3、4，能组成多少个互不相同且无重复数字的三位数？各是多少？
 
 程序分析：可填在百位、十位、个位的数字都是1、2、3、4。组成所有的排列后再去掉不满足条件的排列。
+方法四推广到任意可重数字集合的k排列：生成器按字典序逐个产出且不重复，个数直接计算，
+也可以用NumPy一次生成所有结果。
 """
 
 # def find_three_digit_numbers():
@@ -56,21 +58,130 @@
 
 # 方法四：
 
+from itertools import permutations
+from math import comb
+
+try:
+    import numpy as np
+except ImportError:  # 没有NumPy时只能用生成器逐个产出
+    np = None
+
+def _value_counts(digits):
+    """统计可重集合中每个取值的个数，按取值排序"""
+    counts = {}
+    for d in digits:
+        counts[d] = counts.get(d, 0) + 1
+    return sorted(counts.items())
+
+def multiset_permutations(digits, k):
+    """按字典序惰性产出可重集合digits的所有k排列，相同的排列只产出一次"""
+    items = _value_counts(digits)
+    values = [v for v, _ in items]
+    remain = [c for _, c in items]
+    if k < 0 or k > len(digits):
+        return
+    if len(values) == len(digits):
+        # 没有重复数字时itertools.permutations已按字典序且不重复
+        yield from permutations(values, k)
+        return
+    chosen = [0] * k  # 每一位选用的取值下标
+    pos = 0
+    next_index = 0  # 当前位下一个要尝试的取值下标
+    while True:
+        # 当前位从next_index开始找一个还有剩余的取值
+        i = next_index
+        while i < len(values) and remain[i] == 0:
+            i += 1
+        if pos < k and i < len(values):
+            chosen[pos] = i
+            remain[i] -= 1
+            pos += 1
+            next_index = 0
+            continue
+        if pos == k:
+            yield tuple(values[j] for j in chosen)
+        # 回溯到上一位，换成下一个取值
+        if pos == 0:
+            return
+        pos -= 1
+        remain[chosen[pos]] += 1
+        next_index = chosen[pos] + 1
+
+def count_permutations(digits, k):
+    """不枚举直接计算可重集合的k排列个数
+    
+    依次加入每种取值：已有j位的排列中插入t个相同的取值有C(j+t, t)种方式，
+    对互不相同的n个数字即为n!/(n-k)!
+    """
+    if k < 0 or k > len(digits):
+        return 0
+    ways = [1] + [0] * k  # ways[j]：长度为j的排列个数
+    for _, c in _value_counts(digits):
+        new = [0] * (k + 1)
+        for j, w in enumerate(ways):
+            if w:
+                for t in range(min(c, k - j) + 1):
+                    new[j + t] += w * comb(j + t, t)
+        ways = new
+    return ways[k]
+
+def permutation_numbers(digits, k):
+    """把每个k排列按位拼成整数，惰性产出"""
+    for perm in multiset_permutations(digits, k):
+        num = 0
+        for d in perm:
+            num = num * 10 + d
+        yield num
+
+def permutation_array(digits, k):
+    """一次生成所有k排列拼成的整数，返回从小到大排序的int64数组
+    
+    逐位扩展：每一步对每种取值选出仍有剩余的行，整列计算新值和剩余个数；
+    每层的行数由count_permutations预先算出，直接写入预分配的数组，剩余个数用uint8存放，
+    最后一层不再需要剩余个数，内存峰值约为结果的4倍
+    """
+    if np is None:
+        raise ValueError("需要安装NumPy！")
+    if k > 18:
+        raise ValueError("超过18位的整数会超出int64范围，请使用permutation_numbers！")
+    if k < 0 or k > len(digits):
+        return np.zeros(0, dtype=np.int64)
+    items = _value_counts(digits)
+    numbers = np.zeros(1, dtype=np.int64)
+    # 每种取值最多用k次，剩余个数截断到k后可以放进uint8
+    remain = np.array([[min(c, k) for _, c in items]], dtype=np.uint8)
+    for level in range(1, k + 1):
+        size = count_permutations(digits, level)
+        last = level == k
+        next_numbers = np.empty(size, dtype=np.int64)
+        next_remain = None if last else np.empty((size, len(items)), dtype=np.uint8)
+        offset = 0
+        for i, (v, _) in enumerate(items):
+            rows = remain[:, i] > 0
+            end = offset + int(np.count_nonzero(rows))
+            next_numbers[offset:end] = numbers[rows] * 10 + v
+            if not last:
+                next_remain[offset:end] = remain[rows]
+                next_remain[offset:end, i] -= 1
+            offset = end
+        numbers, remain = next_numbers, next_remain
+    numbers.sort()
+    return numbers
+
 def find_three_numbers():
-    count = 0
-    num = []
-    for i in range(1,5):
-        for j in range(1,5):
-            for k in range(1,5):
-                if i != j and i != k and j != k:
-                    num.append(i*100+j*10+k)
-                    count = count +1
+    num = list(permutation_numbers([1, 2, 3, 4], 3))
+    count = count_permutations([1, 2, 3, 4], 3)
     return count,num
 
 if __name__ == '__main__':
     count,num = find_three_numbers()
     print(f"总数量:{count}")
     print(f"所有三位数:{num}")
+    
+    # 数字可以重复出现时，相同的排列只算一次
+    digits = [1, 1, 2, 3]
+    print(f"\n数字{digits}能组成{count_permutations(digits, 3)}个不同的三位数:"
+          f"{list(permutation_numbers(digits, 3))}")
 
 
 # 方法五：
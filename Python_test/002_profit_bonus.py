@@ -36,22 +36,15 @@
 
 
 
+import progressive_bonus
+
 def sum_bonus(num):
+    """按提成表计算奖金（逐档的if/elif改为查表）"""
+    return progressive_bonus.DEFAULT_TABLE.bonus(num)
 
-    if num <= 100000:
-        bonus = num * 0.1
-    elif num <= 200000:
-        bonus = 100000 * 0.1 + (num -100000) * 0.075
-    elif num <= 400000:
-        bonus = 100000 * 0.1 + 100000 * 0.075 + (num - 200000) * 0.05
-    elif num <= 600000:
-        bonus = 100000 * 0.1 + 100000 * 0.075 + 200000 * 0.05 + (num - 400000) * 0.03
-    elif num <= 1000000:
-        bonus = 100000 * 0.1 + 100000 * 0.075 + 200000 * 0.05 + 200000 * 0.03 + (num - 600000) * 0.015
-    else:
-        bonus = 100000 * 0.1 + 100000 * 0.075 + 200000 * 0.05 + 200000 * 0.03 + 400000 * 0.015 + (num - 1000000) * 0.01
-
-    return bonus
+def sum_bonus_batch(nums):
+    """一次计算一批利润的奖金"""
+    return progressive_bonus.DEFAULT_TABLE.bonus_array(nums)
 
 if __name__ == '__main__':
     num = int(input('请输入利润：'))
@@ -9,6 +9,7 @@
 2. 则：x + 100 = n², x + 100 + 168 = m² (n,m为某些整数)
 3. 设：m² - n² = 168
 4. 计算n²的值，从而求出x的值
+5. 推广到任意的 x + a 与 x + b：按 b - a 的因子对求解，因子分解结果缓存，全程整数运算
 """
 
 # import math
@@ -47,6 +48,9 @@
 
 # 导入math库以使用sqrt函数
 import math
+from functools import lru_cache
+
+import number_theory
 
 def find_integer():
     # 找到所有满足 (m - n)(m + n) = 168 的整数对 (m, n)
@@ -68,5 +72,60 @@ def find_integer():
     
     return possible_x_values
 
+# 方法三：推广到任意偏移量 x + a 和 x + b 都是完全平方数
+
+def is_perfect_square(n):
+    """用整数平方根精确判断完全平方数，不受浮点精度限制"""
+    return n >= 0 and math.isqrt(n) ** 2 == n
+
+@lru_cache(maxsize=1024)
+def _divisors_upto_sqrt(d):
+    """d的所有不超过sqrt(d)的因子（从小到大），分解结果按d缓存，批量查询时可复用"""
+    divisors = [1]
+    factors = number_theory.prime_factors(d)
+    for p in sorted(set(factors)):
+        power, powers = 1, []
+        for _ in range(factors.count(p)):
+            power *= p
+            powers.append(power)
+        divisors += [x * q for x in divisors for q in powers]
+    root = math.isqrt(d)
+    return tuple(sorted(x for x in divisors if x <= root))
+
+def solve_square_offsets(a, b):
+    """求所有整数x，使x + a与x + b都是完全平方数，返回从小到大的列表
+    
+    设 x + a = n², x + b = m²（m, n ≥ 0），则 (m - n)(m + n) = b - a，
+    枚举 b - a 的因子对 p * q（p ≤ q，奇偶性相同），n = (q - p) / 2
+    """
+    if a > b:
+        a, b = b, a
+    d = b - a
+    if d == 0:
+        raise ValueError("a与b相等时有无穷多个解！")
+    if d % 4 == 2:
+        return []  # 两个因子奇偶性必然不同
+    result = []
+    for p in _divisors_upto_sqrt(d):
+        q = d // p
+        if (q - p) % 2 == 0:
+            n = (q - p) // 2
+            result.append(n * n - a)
+    return sorted(result)
+
+def solve_batch(queries):
+    """批量求解多组(a, b)，相同的差值只分解一次"""
+    return [solve_square_offsets(a, b) for a, b in queries]
+
 # 打印结果
 print(find_integer())
+
+if __name__ == '__main__':
+    solutions = solve_square_offsets(100, 268)
+    # 与方法二的结果核对，并逐个验证x + 100与x + 268都是完全平方数
+    matched = sorted(find_integer()) == solutions
+    print(f"通用解法与方法二的结果{'一致' if matched else '不一致！'}")
+    valid = all(is_perfect_square(x + 100) and is_perfect_square(x + 268) for x in solutions)
+    print(f"所有解{'均满足条件' if valid else '中有不满足条件的数！'}")
+    for x in solutions:
+        print(f"{x} + 100 = {math.isqrt(x + 100)}², {x} + 268 = {math.isqrt(x + 268)}²")
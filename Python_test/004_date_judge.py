@@ -65,18 +65,20 @@
 
 
 
-# 方法二：
-year = int(input('年：'))
-month = int(input('月：'))
-day = int(input('日:'))
-
-# 闰年的
-months01 = [31,60,91,121,152,182,213,244,274,305,335,366]
-# 非闰年的
-months02 = [31,59,90,120,151,181,212,243,273,304,334,365]
-
-if year % 4 == 0 and year % 100 != 0 or year % 400 == 0:
-    print(months01[month-1]+day)
-else:
-    print(months02[month-1]+day)
-
+# 方法二：查累计天数表，不再每次对月份切片求和
+
+# 闰年每月之前的累计天数
+months01 = [0,31,60,91,121,152,182,213,244,274,305,335]
+# 非闰年每月之前的累计天数
+months02 = [0,31,59,90,120,151,181,212,243,273,304,334]
+
+def day_of_year(year, month, day):
+    if year % 4 == 0 and year % 100 != 0 or year % 400 == 0:
+        return months01[month-1]+day
+    return months02[month-1]+day
+
+if __name__ == '__main__':
+    year = int(input('年：'))
+    month = int(input('月：'))
+    day = int(input('日:'))
+    print(day_of_year(year, month, day))
@@ -5,11 +5,40 @@
 题目：对字符串进行简单的加密。
 
 程序分析：
-1. 对每个字符的ASCII码进行操作
+1. 对每个英文字母的ASCII码进行操作
 2. 提供加密和解密两个功能
 3. 可以指定偏移量
+4. 按偏移量缓存转换表，用translate整串转换，大文件按字节分块处理
 """
 
+import codecs
+import string
+from functools import lru_cache
+
+CHUNK_SIZE = 1 << 20  # 批量处理文件时每次读取1MB
+# 按字节转换只对这些编码安全：ASCII字节不会出现在多字节字符内部
+# （GBK、Shift-JIS的第二个字节、UTF-16的每个字符都可能包含ASCII范围的字节）
+BYTE_SAFE_ENCODINGS = ('ascii', 'utf-8', 'utf-8-sig', 'iso8859-1')
+
+@lru_cache(maxsize=None)
+def _shift_map(offset):
+    """偏移后的字母映射：(原字母, 新字母)"""
+    offset %= 26
+    lower, upper = string.ascii_lowercase, string.ascii_uppercase
+    return (lower + upper,
+            lower[offset:] + lower[:offset] + upper[offset:] + upper[:offset])
+
+@lru_cache(maxsize=None)
+def _str_table(offset):
+    """str.translate 使用的转换表，按偏移量缓存"""
+    return str.maketrans(*_shift_map(offset))
+
+@lru_cache(maxsize=None)
+def _bytes_table(offset):
+    """bytes.translate 使用的256字节转换表，按偏移量缓存"""
+    source, target = _shift_map(offset)
+    return bytes.maketrans(source.encode('ascii'), target.encode('ascii'))
+
 def encrypt(text, offset=3):
     """
     加密字符串
@@ -17,18 +46,8 @@ def encrypt(text, offset=3):
     :param offset: 偏移量，默认为3
     :return: 加密后的字符串
     """
-    result = ''
-    for char in text:
-        if char.isalpha():
-            # 处理字母
-            ascii_offset = ord('A') if char.isupper() else ord('a')
-            # 计算新的字符位置并确保在字母范围内
-            new_pos = (ord(char) - ascii_offset + offset) % 26
-            result += chr(ascii_offset + new_pos)
-        else:
-            # 非字母字符保持不变
-            result += char
-    return result
+    # 只移动英文字母，其余字符保持不变；整串一次转换，不逐个拼接
+    return text.translate(_str_table(offset % 26))
 
 def decrypt(text, offset=3):
     """
@@ -39,6 +58,45 @@ def decrypt(text, offset=3):
     """
     return encrypt(text, -offset)
 
+def _check_encoding(encoding):
+    """只允许按字节转换安全的编码"""
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        raise ValueError(f"未知的编码：{encoding}")
+    if name not in BYTE_SAFE_ENCODINGS:
+        raise ValueError(f"不支持按字节加密{encoding}编码的文本，请先转换为UTF-8！")
+
+def encrypt_stream(source, target, offset=3, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """
+    分块加密二进制流，不解码
+    只支持ASCII、UTF-8、Latin-1：这些编码中ASCII字节不会出现在多字节字符内部，按字节转换即可；
+    GBK、Shift-JIS、UTF-16等编码会被按字节转换破坏，直接拒绝
+    :param source: 可读的二进制文件对象
+    :param target: 可写的二进制文件对象
+    :param encoding: 流的文本编码
+    :return: 处理的字节数
+    """
+    _check_encoding(encoding)
+    table = _bytes_table(offset % 26)
+    total = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return total
+        target.write(chunk.translate(table))
+        total += len(chunk)
+
+def encrypt_file(src_path, dst_path, offset=3, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """加密整个文件，返回处理的字节数"""
+    _check_encoding(encoding)  # 打开目标文件前检查，避免清空已有文件
+    with open(src_path, 'rb') as source, open(dst_path, 'wb') as target:
+        return encrypt_stream(source, target, offset, chunk_size, encoding)
+
+def decrypt_file(src_path, dst_path, offset=3, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """解密整个文件，返回处理的字节数"""
+    return encrypt_file(src_path, dst_path, -offset, chunk_size, encoding)
+
 if __name__ == '__main__':
     # 测试加密解密功能
     original_text = "Hello, World! 123"
@@ -7,24 +7,18 @@
 程序分析：
 1. 判断素数的方法：用一个数分别去除2到sqrt(这个数)，如果能被整除，则表明此数不是素数，反之是素数。
 2. 使用列表推导式和filter函数可以使代码更简洁。
+3. 区间查找改用公共模块 number_theory 的分段筛，单个数的判断改用Miller-Rabin，适用于大范围。
 """
 
-import math
+import number_theory
 
 def is_prime(n):
-    """判断一个数是否为素数"""
-    if n < 2:
-        return False
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if n % i == 0:
-            return False
-    return True
+    """判断一个数是否为素数（Miller-Rabin）"""
+    return number_theory.is_prime(n)
 
 def find_primes(start, end):
-    """在指定范围内找出所有素数"""
-    # 使用列表推导式
-    primes = [num for num in range(start, end + 1) if is_prime(num)]
-    return primes
+    """在指定范围内找出所有素数（分段筛）"""
+    return number_theory.find_primes(start, end)
 
 def find_primes_filter(start, end):
     """使用filter函数找出素数"""
@@ -33,7 +27,7 @@ def find_primes_filter(start, end):
 if __name__ == '__main__':
     start, end = 101, 200
     
-    # 使用列表推导式方法
+    # 使用分段筛方法
     primes = find_primes(start, end)
     print(f"在{start}-{end}之间的素数个数为：{len(primes)}")
     print(f"素数列表：{primes}")
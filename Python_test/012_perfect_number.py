@@ -8,23 +8,32 @@
 1. 遍历1-1000的数
 2. 对每个数找出它的所有因子（不包括自身）
 3. 判断因子之和是否等于该数
+4. 用因子和筛一次求出整个范围的因子之和；完数也可由梅森素数直接生成
 """
 
+import math
+
+import number_theory
+
 def get_factors(n):
-    """获取一个数的所有因子（不包括自身）"""
-    factors = []
-    for i in range(1, n):
+    """获取一个数的所有因子（不包括自身），只枚举到sqrt(n)"""
+    small, large = [], []
+    for i in range(1, math.isqrt(n) + 1):
         if n % i == 0:
-            factors.append(i)
-    return factors
+            small.append(i)
+            if i * i != n:
+                large.append(n // i)
+    factors = small + large[::-1]
+    return factors[:-1]  # 去掉自身
 
 def find_perfect_numbers(limit):
-    """找出指定范围内的所有完数"""
-    perfect_nums = []
-    for num in range(2, limit + 1):
-        if sum(get_factors(num)) == num:
-            perfect_nums.append(num)
-    return perfect_nums
+    """找出指定范围内的所有完数（欧几里得-欧拉定理 + Lucas-Lehmer检验）"""
+    return number_theory.perfect_numbers(2, limit)
+
+def find_perfect_numbers_sieve(limit):
+    """用因子和筛找出指定范围内的所有完数"""
+    sums = number_theory.divisor_sums(1, limit)
+    return [num for num in range(2, limit + 1) if sums[num - 1] == num]
 
 if __name__ == '__main__':
     limit = 1000
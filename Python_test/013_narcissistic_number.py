@@ -9,8 +9,13 @@
 1. 遍历所有的三位数（100-999）
 2. 将每个数分解出个、十、百位
 3. 计算每个位数的立方和并判断
+4. 推广到任意位数的自幂数：枚举数字多重集并剪枝，不遍历全部n位数
 """
 
+from concurrent.futures import ProcessPoolExecutor
+
+DIGITS = '0123456789'
+
 def is_narcissistic(num):
     """判断一个数是否为水仙花数"""
     # 获取各个位数
@@ -23,9 +28,93 @@ def is_narcissistic(num):
     
     return sum_of_cubes == num
 
+def is_armstrong(num):
+    """判断一个正整数是否等于其各位数字的n次方之和（n为位数）"""
+    digits = str(num)
+    n = len(digits)
+    return num == sum(int(c) ** n for c in digits)
+
+def armstrong_numbers(n):
+    """找出所有n位的自幂数
+    
+    不遍历全部10^n个数，而是枚举各数字出现的次数（数字多重集）：
+    从9到0依次决定每个数字用几次，幂次表预先算好，部分和可以增量维护；
+    已定部分和加上剩余位全取当前数字时的上界与下界有公共前缀时，
+    前缀中的数字必须与已选的次数相容，否则整棵子树剪掉；
+    另外自幂数与其数字和模9同余，数字2的次数只需试满足同余的取值
+    """
+    powers = [d ** n for d in range(10)]
+    residue = [(powers[d] - d) % 9 for d in range(10)]
+    low, high = 10 ** (n - 1), 10 ** n - 1
+    counts = [0] * 10  # 各数字已选的次数
+    result = []
+    
+    def search(d, r, total, mod):
+        """数字d..0还剩r个位置，已选数字的幂次和为total，mod为同余校验值"""
+        upper = min(total + r * powers[d], high)
+        if total > upper or upper < low:
+            return
+        # 上下界的公共前缀就是最终结果的前缀
+        a, b = str(total).zfill(n), str(upper)
+        i = n - len(str(upper - total))
+        while i > 0 and a[:i] != b[:i]:
+            i -= 1
+        least = 0
+        if i:
+            prefix = a[:i]
+            need = 0
+            for k in range(10):
+                c = prefix.count(DIGITS[k])
+                if k > d:
+                    if c > counts[k]:
+                        return
+                else:
+                    need += c
+            if need > r:
+                return
+            least = prefix.count(DIGITS[d])
+        
+        if d == 1:
+            # 0和1的幂等于自身，逐个尝试1的个数
+            for c in range(least, r + 1):
+                counts[1], counts[0] = c, r - c
+                digits = str(total + c)
+                if total + c >= low and len(digits) == n and all(digits.count(DIGITS[k]) == counts[k] for k in range(10)):
+                    result.append(total + c)
+            counts[1] = counts[0] = 0
+            return
+        
+        p, q, m = powers[d], powers[d - 1], residue[d]
+        for c in range(r, least - 1, -1):
+            partial = total + c * p
+            if partial > high:
+                continue
+            if partial + (r - c) * q < low:
+                break
+            next_mod = (mod + c * m) % 9
+            if d == 2 and next_mod:
+                continue
+            counts[d] = c
+            search(d - 1, r - c, partial, next_mod)
+        counts[d] = 0
+    
+    if n >= 1:
+        search(9, n, 0, 0)
+    return sorted(result)
+
+def find_armstrong_numbers(max_digits, workers=None):
+    """找出不超过max_digits位的所有自幂数，各位数互不相关，用进程池并行计算"""
+    lengths = range(max_digits, 0, -1)  # 位数大的耗时长，先提交
+    if workers == 1 or max_digits <= 10:
+        results = list(map(armstrong_numbers, lengths))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(armstrong_numbers, lengths))
+    return sorted(num for nums in results for num in nums)
+
 def find_narcissistic_numbers():
     """找出所有的水仙花数"""
-    return [num for num in range(100, 1000) if is_narcissistic(num)]
+    return armstrong_numbers(3)
 
 if __name__ == '__main__':
     narcissistic_numbers = find_narcissistic_numbers()
@@ -38,4 +127,15 @@ if __name__ == '__main__':
         ones = num % 10
         print(f"\n验证 {num}:")
         print(f"{hundreds}³ + {tens}³ + {ones}³ = "
-              f"{hundreds**3} + {tens**3} + {ones**3} = {num}") 
\ No newline at end of file
+              f"{hundreds**3} + {tens**3} + {ones**3} = {num}")
+    
+    try:
+        max_digits = int(input("\n请输入要查找的自幂数的最大位数："))
+        if max_digits <= 0:
+            raise ValueError("位数必须为正整数！")
+        armstrong = find_armstrong_numbers(max_digits)
+        print(f"不超过{max_digits}位的自幂数共{len(armstrong)}个：")
+        for num in armstrong:
+            print(num)
+    except ValueError as e:
+        print(f"错误：{str(e)}")
@@ -9,10 +9,17 @@
 2. 如果能整除，则将商继续分解
 3. 如果不能整除，则尝试下一个质数
 4. 重复上述过程直到最后的商为1
+5. 大整数改用公共模块 number_theory 中的Miller-Rabin与Pollard-rho分解
 """
 
+import number_theory
+
 def prime_factors(n):
-    """分解质因数"""
+    """分解质因数：小因子试除，大因子用Pollard-rho"""
+    return number_theory.prime_factors(n)
+
+def prime_factors_trial(n):
+    """分解质因数（逐个试除）"""
     factors = []
     divisor = 2
     
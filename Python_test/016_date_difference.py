@@ -8,10 +8,20 @@
 1. 使用datetime模块处理日期
 2. 计算输入日期与当年第一天的差值
 3. 注意处理输入验证
+4. 批量处理时不创建日期对象：查累计天数表并用闰年掩码修正，整列向量化计算
+5. 日期差按公历日序号相减；也支持datetime64，可一次转换 data/us_report 中所有CSV的日期列
 """
 
+import csv
+import glob
+import os
 from datetime import datetime, date
 
+try:
+    import numpy as np
+except ImportError:  # 没有NumPy时批量接口逐个查表计算
+    np = None
+
 def day_of_year_datetime(year, month, day):
     """使用datetime计算是当年的第几天"""
     try:
@@ -25,6 +35,79 @@ def day_of_year_datetime(year, month, day):
     except ValueError:
         return None
 
+# 平年每月之前的累计天数
+CUMULATIVE_DAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def is_leap(year):
+    """判断闰年（year可以是整数或NumPy数组）"""
+    return (year % 4 == 0) & (year % 100 != 0) | (year % 400 == 0)
+
+def day_of_year_table(year, month, day):
+    """查累计天数表计算是当年的第几天，不创建日期对象；日期无效时返回None"""
+    if not 1 <= month <= 12:
+        return None
+    leap = bool(is_leap(year))
+    if not 1 <= day <= MONTH_DAYS[month - 1] + (leap and month == 2):
+        return None
+    return CUMULATIVE_DAYS[month - 1] + day + (leap and month > 2)
+
+def day_of_year_array(years, months, days):
+    """批量计算第几天：查表加闰年掩码，整列一次完成；有无效日期时抛出ValueError"""
+    if np is None:
+        result = [day_of_year_table(y, m, d) for y, m, d in zip(years, months, days)]
+        if None in result:
+            raise ValueError("存在无效的日期！")
+        return result
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    if ((months < 1) | (months > 12)).any():
+        raise ValueError("存在无效的日期！")
+    leap = is_leap(years)
+    limit = np.array(MONTH_DAYS)[months - 1] + (leap & (months == 2))
+    if ((days < 1) | (days > limit)).any():
+        raise ValueError("存在无效的日期！")
+    return np.array(CUMULATIVE_DAYS)[months - 1] + days + (leap & (months > 2))
+
+def days_from_civil(years, months, days):
+    """距1970-01-01的天数，整数或数组均可
+    
+    把3月当作一年的第一个月，闰日落在年末，年内天数可以用 (153 * m + 2) // 5 直接算出
+    """
+    years = years - (months <= 2)
+    era = years // 400
+    yoe = years - era * 400                                  # [0, 399]
+    doy = (153 * ((months + 9) % 12) + 2) // 5 + days - 1    # [0, 365]
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy            # [0, 146096]
+    return era * 146097 + doe - 719468
+
+def date_difference_array(start, end):
+    """批量计算日期差（天），start和end均为(年数组, 月数组, 日数组)"""
+    if np is not None:
+        start = [np.asarray(col, dtype=np.int64) for col in start]
+        end = [np.asarray(col, dtype=np.int64) for col in end]
+        return days_from_civil(*end) - days_from_civil(*start)
+    return [days_from_civil(*b) - days_from_civil(*a) for a, b in zip(zip(*start), zip(*end))]
+
+def day_of_year_datetime64(dates):
+    """datetime64路径：日期字符串或datetime64数组 -> 第几天，缺失的日期为-1"""
+    dates = np.asarray(dates).astype('datetime64[D]')
+    result = (dates - dates.astype('datetime64[Y]')).astype(np.int64) + 1
+    result[np.isnat(dates)] = -1
+    return result
+
+def load_date_column(paths, column='Last_Update'):
+    """读取多个CSV文件的日期列（取前10个字符YYYY-MM-DD），合成一个datetime64数组"""
+    values = []
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            if column not in (reader.fieldnames or []):
+                raise ValueError(f"{path} 中没有列：{column}")
+            values.extend(row[column][:10] for row in reader)
+    return np.array(values, dtype='datetime64[D]')
+
 if __name__ == '__main__':
     try:
         year = int(input('年：'))
@@ -37,4 +120,14 @@ if __name__ == '__main__':
         else:
             print('请输入有效的日期！')
     except ValueError:
-        print('请输入有效的数字！') 
\ No newline at end of file
+        print('请输入有效的数字！')
+    
+    # 一次转换 data/us_report 下所有CSV文件的日期列
+    report_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'us_report')
+    paths = sorted(glob.glob(os.path.join(report_dir, '*.csv')))
+    if paths and np is not None:
+        dates = load_date_column(paths)
+        doy = day_of_year_datetime64(dates)
+        valid = doy >= 0
+        print(f'\n已转换 {len(paths)} 个文件共 {len(dates)} 个日期，'
+              f'范围为第 {doy[valid].min()} 天到第 {doy[valid].max()} 天')
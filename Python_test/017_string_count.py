@@ -8,9 +8,18 @@
 1. 利用字符串的各种判断方法
 2. 也可以使用正则表达式
 3. 需要考虑Unicode字符
+4. 单遍统计字符频数（可用NumPy加速）后按不同字符分类，大文件分块读取
 """
 
 import re
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # 没有NumPy时用Counter统计频数
+    np = None
+
+CHUNK_SIZE = 1 << 20  # 统计文件时每次读取1M个字符
 
 def count_chars_method1(text):
     """使用字符串方法统计"""
@@ -28,6 +37,45 @@ def count_chars_method2(text):
     others = len(text) - letters - spaces - digits
     return letters, spaces, digits, others
 
+def classify_counts(counts):
+    """按字符频数表汇总四类字符的个数，每个不同字符只判断一次"""
+    letters = spaces = digits = others = 0
+    for c, n in counts.items():
+        if c.isalpha():
+            letters += n
+        elif c.isspace():
+            spaces += n
+        elif c.isdigit():
+            digits += n
+        else:
+            others += n
+    return letters, spaces, digits, others
+
+def char_frequencies(text):
+    """单遍统计字符频数：有NumPy时对UTF-32码点做bincount，否则用Counter"""
+    if np is None:
+        return Counter(text)
+    codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    freq = np.bincount(codes)
+    chars = np.flatnonzero(freq)
+    return Counter(dict(zip(map(chr, chars.tolist()), freq[chars].tolist())))
+
+def count_chars_method3(text):
+    """单遍统计：一次扫描得到频数表，再按不同字符分类（结果与方法1一致）"""
+    return classify_counts(char_frequencies(text))
+
+def count_chars_stream(chunks):
+    """分块统计文本流，chunks为字符串块的可迭代对象"""
+    counts = Counter()
+    for chunk in chunks:
+        counts.update(char_frequencies(chunk))
+    return classify_counts(counts)
+
+def count_chars_file(path, encoding='utf-8', chunk_size=CHUNK_SIZE):
+    """分块统计整个文件，内存占用与文件大小无关"""
+    with open(path, encoding=encoding) as f:
+        return count_chars_stream(iter(lambda: f.read(chunk_size), ''))
+
 if __name__ == '__main__':
     text = input('请输入一行字符：')
     
@@ -45,4 +93,12 @@ if __name__ == '__main__':
     print(f'英文字母：{letters2}')
     print(f'空格：{spaces2}')
     print(f'数字：{digits2}')
-    print(f'其他字符：{others2}') 
\ No newline at end of file
+    print(f'其他字符：{others2}')
+    
+    # 单遍统计
+    letters3, spaces3, digits3, others3 = count_chars_method3(text)
+    print('\n使用单遍统计结果：')
+    print(f'英文字母：{letters3}')
+    print(f'空格：{spaces3}')
+    print(f'数字：{digits3}')
+    print(f'其他字符：{others3}') 
\ No newline at end of file
@@ -16,21 +16,15 @@ I≤10万元时，奖金可提10%
 I>100万时，超过100万元的部分按1%提成
 """
 
+import progressive_bonus
+
 def calculate_bonus(profit):
-    """计算奖金"""
-    # 设置阶梯界限和对应的提成比例
-    thresholds = [1000000, 600000, 400000, 200000, 100000, 0]
-    rates = [0.01, 0.015, 0.03, 0.05, 0.075, 0.1]
-    
-    bonus = 0
-    for i in range(len(thresholds)):
-        if profit > thresholds[i]:
-            # 计算当前阶梯的奖金
-            bonus += (profit - thresholds[i]) * rates[i]
-            # 更新剩余利润
-            profit = thresholds[i]
-    
-    return bonus
+    """计算奖金：在提成表中定位利润所在的档，加上该档起点处已累计的奖金"""
+    return progressive_bonus.DEFAULT_TABLE.bonus(profit)
+
+def calculate_bonus_batch(profits):
+    """批量计算奖金（np.searchsorted一次定位所有利润所在的档）"""
+    return progressive_bonus.DEFAULT_TABLE.bonus_array(profits)
 
 def format_currency(amount):
     """格式化货币输出"""
@@ -9,8 +9,11 @@
 1. 函数要返回一个数的所有因子
 2. 判断因子之和是否等于原数
 3. 注意优化性能
+4. 范围查找不再逐个判断：完数由梅森素数生成，完数/盈数/亏数的统计使用因子和筛
 """
 
+import number_theory
+
 def get_factors(num):
     """获取一个数的所有因子（不包括自身）"""
     factors = set()  # 使用集合避免重复
@@ -28,8 +31,12 @@ def is_perfect(num):
     return sum(get_factors(num)) == num
 
 def find_perfect_numbers(start, end):
-    """在指定范围内找出所有完数"""
-    return [num for num in range(start, end + 1) if is_perfect(num)]
+    """在指定范围内找出所有完数（欧几里得-欧拉定理 + Lucas-Lehmer检验）"""
+    return number_theory.perfect_numbers(start, end)
+
+def classify_numbers(start, end):
+    """用因子和筛统计范围内完数、盈数、亏数的个数"""
+    return number_theory.classify_range(start, end)
 
 def verify_perfect_number(num):
     """验证一个完数，返回其因子和计算过程"""
@@ -43,4 +50,7 @@ if __name__ == '__main__':
     print(f"在{start}到{end}之间的完数有：{perfect_numbers}")
     print("\n验证每个完数：")
     for num in perfect_numbers:
-        print(verify_perfect_number(num)) 
\ No newline at end of file
+        print(verify_perfect_number(num))
+    
+    perfect, abundant, deficient = classify_numbers(start, end)
+    print(f"\n完数 {perfect} 个，盈数 {abundant} 个，亏数 {deficient} 个")
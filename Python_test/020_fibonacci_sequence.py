@@ -9,11 +9,21 @@
 2. 实现递归和非递归两种方式
 3. 比较两种方式的性能差异
 4. 添加缓存优化递归方式
+5. 快速倍增法O(log n)求单项（可选用gmpy2加速大整数乘法），取模时先按皮萨诺周期缩小n，支持批量计算多项
 """
 
 from functools import lru_cache
+import math
+import sys
 import time
 
+import number_theory
+
+try:
+    from gmpy2 import mpz
+except ImportError:  # 没有gmpy2时使用Python内置大整数
+    mpz = None
+
 @lru_cache(maxsize=None)
 def fibonacci_recursive(n):
     """递归方式实现斐波那契数列（带缓存）"""
@@ -36,19 +46,143 @@ def fibonacci_iterative(n):
         a, b = b, a + b
     return b
 
-def compare_performance(n):
-    """比较两种方法的性能"""
-    # 测试递归方法
-    start_time = time.time()
-    result1 = fibonacci_recursive(n)
-    recursive_time = time.time() - start_time
+def fibonacci_pair(n, mod=None):
+    """快速倍增：返回(F(n), F(n+1))，按n的二进制位从高到低迭代，不递归
+    
+    F(2k) = F(k) * (2F(k+1) - F(k))，F(2k+1) = F(k)² + F(k+1)²
+    """
+    a, b = 0, 1  # F(0), F(1)
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod is not None:
+            c %= mod
+            d %= mod
+        if bit == '1':
+            a, b = d, c + d
+            if mod is not None:
+                b %= mod
+        else:
+            a, b = c, d
+    return a, b
+
+def fibonacci_fast(n):
+    """快速倍增计算第n项，每个二进制位只做两次平方
     
-    # 测试迭代方法
-    start_time = time.time()
-    result2 = fibonacci_iterative(n)
-    iterative_time = time.time() - start_time
+    由(F(k-1), F(k))得到：F(2k-1) = F(k)² + F(k-1)²，
+    F(2k+1) = 4F(k)² - F(k-1)² + 2(-1)^k，F(2k) = F(2k+1) - F(2k-1)
+    """
+    if n <= 0:
+        return 0
+    # 安装了gmpy2时用GMP大整数做乘法，项数很大时快得多
+    a, b = (mpz(0), mpz(1)) if mpz is not None else (0, 1)  # F(k-1), F(k)，k = 1
+    odd = True  # k是否为奇数
+    for bit in bin(n)[3:]:
+        aa, bb = a * a, b * b
+        prev = aa + bb                             # F(2k-1)
+        succ = 4 * bb - aa + (-2 if odd else 2)    # F(2k+1)
+        if bit == '1':
+            a, b = succ - prev, succ
+        else:
+            a, b = prev, succ - prev
+        odd = bit == '1'
+    return int(b)
+
+def _prime_pisano(p):
+    """素数p的皮萨诺周期：π(2)=3，π(5)=20，其余是p-1或2(p+1)的因子"""
+    if p == 2:
+        return 3
+    if p == 5:
+        return 20
+    period = p - 1 if p % 5 in (1, 4) else 2 * (p + 1)
+    # 在候选周期的因子中找最小的周期：依次尝试去掉每个质因子
+    for q in set(number_theory.prime_factors(period)):
+        while period % q == 0 and fibonacci_pair(period // q, p) == (0, 1):
+            period //= q
+    return period
+
+@lru_cache(maxsize=256)
+def pisano_period(m):
+    """F(n) mod m的周期：对m分解质因数，π(p^k) = p^(k-1)·π(p)，再取最小公倍数"""
+    if m <= 0:
+        raise ValueError("模数必须为正整数！")
+    if m == 1:
+        return 1
+    factors = number_theory.prime_factors(m)
+    period = 1
+    for p in set(factors):
+        period = math.lcm(period, p ** (factors.count(p) - 1) * _prime_pisano(p))
+    if fibonacci_pair(period, m) != (0, 1):
+        raise ValueError("皮萨诺周期校验失败！")
+    return period
+
+def fibonacci_mod(n, m, use_period=True):
+    """计算F(n) mod m；周期已知时先把n对周期取模"""
+    if n <= 0:
+        return 0
+    if use_period:
+        n %= pisano_period(m)
+    return fibonacci_pair(n, m)[0]
+
+def fibonacci_batch(indices, mod=None):
+    """批量计算多项：排好序后从上一个结果出发，间隔小时逐项递推，间隔大时用加法公式跳跃
     
-    return result1, result2, recursive_time, iterative_time
+    F(a+d) = F(a)F(d-1) + F(a+1)F(d)，F(a+d+1) = F(a)F(d) + F(a+1)F(d+1)
+    """
+    indices = list(indices)
+    results = {}
+    current, a, b = 0, 0, 1  # a = F(current)，b = F(current+1)
+    for n in sorted(set(i for i in indices if i > 0)):
+        step = n - current
+        if step <= 64:
+            for _ in range(step):
+                a, b = b, a + b
+                if mod is not None:
+                    b %= mod
+        else:
+            f, g = fibonacci_pair(step, mod)  # F(d), F(d+1)
+            a, b = a * (g - f) + b * f, a * f + b * g
+            if mod is not None:
+                a %= mod
+                b %= mod
+        current = n
+        results[n] = a
+    return [results.get(i, 0) for i in indices]
+
+# 带缓存的递归方式每层占两个栈帧（缓存包装和函数本身），冷缓存时在此项数以内不会超出递归深度
+RECURSION_SAFE = sys.getrecursionlimit() // 2 - 50
+ITERATIVE_SAFE = 100000  # 迭代方式在此项数以内耗时可接受
+
+def compare_performance(n):
+    """比较各种方法的性能，返回[(方法名, 结果, 耗时)]；规模过大时跳过慢的方法（结果为None）"""
+    methods = [
+        ("递归方法", fibonacci_recursive, n <= RECURSION_SAFE),
+        ("迭代方法", fibonacci_iterative, n <= ITERATIVE_SAFE),
+        ("快速倍增", fibonacci_fast, True),
+    ]
+    results = []
+    for name, func, enabled in methods:
+        if not enabled:
+            results.append((name, None, None))
+            continue
+        start_time = time.perf_counter()
+        try:
+            result = func(n)
+        except RecursionError:
+            # 调用时栈已较深，仍然超出递归深度，按跳过处理
+            results.append((name, None, None))
+            continue
+        results.append((name, result, time.perf_counter() - start_time))
+    return results
+
+def describe(value):
+    """大整数只显示位数和首尾几位"""
+    digits = str(value) if value.bit_length() < 10000 else None
+    if digits is not None and len(digits) <= 60:
+        return digits
+    if digits is None:
+        return f"约{int(value.bit_length() * math.log10(2)) + 1}位，末尾为...{value % 10 ** 20:020d}"
+    return f"{digits[:20]}...{digits[-20:]}（共{len(digits)}位）"
 
 if __name__ == '__main__':
     try:
@@ -56,17 +190,25 @@ if __name__ == '__main__':
         if n < 0:
             print("请输入非负整数！")
         else:
-            result1, result2, rec_time, iter_time = compare_performance(n)
             print(f"\n第{n}项的值：")
-            print(f"递归方法结果：{result1}")
-            print(f"迭代方法结果：{result2}")
+            results = compare_performance(n)
+            for name, result, _ in results:
+                if result is None:
+                    print(f"{name}：规模过大，跳过")
+                else:
+                    print(f"{name}结果：{describe(result)}")
             print(f"\n性能比较：")
-            print(f"递归方法耗时：{rec_time:.6f}秒")
-            print(f"迭代方法耗时：{iter_time:.6f}秒")
+            for name, _, seconds in results:
+                if seconds is not None:
+                    print(f"{name}耗时：{seconds:.6f}秒")
+            
+            m = 10 ** 9 + 7
+            print(f"\nF({n}) mod {m} = {fibonacci_mod(n, m)}（周期 {pisano_period(m)}）")
             
             # 打印前n项
-            print(f"\n斐波那契数列前{n}项：")
-            sequence = [fibonacci_iterative(i) for i in range(n)]
-            print(sequence)
-    except ValueError:
-        print("请输入有效的整数！") 
\ No newline at end of file
+            if n <= 100:
+                print(f"\n斐波那契数列前{n}项：")
+                sequence = fibonacci_batch(range(n))
+                print(sequence)
+    except ValueError as e:
+        print(f"错误：{str(e)}")
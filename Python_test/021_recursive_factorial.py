@@ -8,8 +8,22 @@
 1. 递归公式：n! = n * (n-1)!
 2. 递归终止条件：0! = 1
 3. 同时实现递归和迭代两种方法
+4. 大数阶乘用乘积树或素数摆动法，让参与乘法的数大小接近；也可多进程分段求积
+5. 支持 n! mod m 和卢卡斯定理求组合数取模
 """
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from math import prod
+
+import number_theory
+
+try:
+    from gmpy2 import mpz
+except ImportError:  # 没有gmpy2时使用Python内置大整数
+    mpz = None
+
 def factorial_recursive(n):
     """递归方法计算阶乘"""
     if n < 0:
@@ -27,6 +41,124 @@ def factorial_iterative(n):
         result *= i
     return result
 
+LEAF_SIZE = 32  # 乘积树叶子上直接连乘的整数个数
+
+def _product_tree(factors):
+    """乘积树：相邻两项两两相乘直到只剩一项，参与乘法的数大小接近，不递归
+    
+    安装了gmpy2时用GMP大整数做乘法，返回mpz
+    """
+    values = [mpz(x) for x in factors] if mpz is not None else list(factors)
+    if not values:
+        return mpz(1) if mpz is not None else 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+def product_tree(factors):
+    """一组整数的乘积（乘积树）"""
+    return int(_product_tree(factors))
+
+def product_range(low, high):
+    """[low, high)内所有整数的乘积，叶子上连乘一小段后再用乘积树合并"""
+    leaves = [prod(range(i, min(i + LEAF_SIZE, high))) for i in range(low, high, LEAF_SIZE)]
+    return product_tree(leaves)
+
+def factorial_binary_split(n):
+    """二分乘积树计算阶乘"""
+    if n < 0:
+        raise ValueError("负数没有阶乘")
+    return product_range(2, n + 1)
+
+def _swing(m, primes):
+    """摆动阶乘 m≀ = m! / ((m//2)!)²，即每个素数p的指数为 Σ(m // p^k 的奇偶)"""
+    factors = []
+    for p in primes:
+        if p > m:
+            break
+        e, q = 0, m
+        while q:
+            q //= p
+            e += q & 1
+        if e:
+            factors.append(p ** e if e > 1 else p)
+    return _product_tree(factors)
+
+def factorial_prime_swing(n):
+    """素数摆动法：n! = ((n//2)!)² · n≀，从小到大迭代，平方比普通乘法快"""
+    if n < 0:
+        raise ValueError("负数没有阶乘")
+    primes = number_theory.simple_sieve(n)
+    levels = []
+    while n > 1:
+        levels.append(n)
+        n //= 2
+    result = 1
+    for m in reversed(levels):
+        result = result * result * _swing(m, primes)
+    return int(result)
+
+def factorial_parallel(n, workers=None, chunks=None):
+    """多进程计算阶乘：把[2, n]切成若干段分别求积，再用乘积树合并各段结果"""
+    if n < 0:
+        raise ValueError("负数没有阶乘")
+    chunks = chunks or 4 * (workers or os.cpu_count() or 1)
+    size = max(LEAF_SIZE, (n - 1) // chunks + 1)
+    lows = list(range(2, n + 1, size))
+    highs = [min(low + size, n + 1) for low in lows]
+    if len(lows) <= 1 or workers == 1:
+        parts = list(map(product_range, lows, highs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(product_range, lows, highs))
+    return product_tree(parts)
+
+def factorial_mod(n, m):
+    """计算 n! mod m
+    
+    n ≥ m时结果为0；m为素数且n接近m时用威尔逊定理 (m-1)! ≡ -1 反推，只需乘 m-1-n 项
+    """
+    if n < 0:
+        raise ValueError("负数没有阶乘")
+    if m <= 0:
+        raise ValueError("模数必须为正整数！")
+    if n >= m:
+        return 0
+    if m - 1 - n < n and number_theory.is_prime(m):
+        # n! ≡ -1 / ((n+1)(n+2)...(m-1)) (mod m)
+        tail = 1
+        for i in range(n + 1, m):
+            tail = tail * i % m
+        return -pow(tail, -1, m) % m
+    result = 1 % m
+    for i in range(2, n + 1):
+        result = result * i % m
+    return result
+
+def binomial_mod(n, k, p):
+    """组合数 C(n, k) mod p（p为素数），卢卡斯定理逐位计算，每位只乘 min(k, n-k) 项"""
+    if not number_theory.is_prime(p):
+        raise ValueError("模数必须为素数！")
+    if k < 0 or k > n:
+        return 0
+    result = 1
+    while n or k:
+        ni, ki = n % p, k % p
+        if ki > ni:
+            return 0
+        ki = min(ki, ni - ki)
+        numerator = denominator = 1
+        for i in range(ki):
+            numerator = numerator * (ni - i) % p
+            denominator = denominator * (i + 1) % p
+        result = result * numerator * pow(denominator, -1, p) % p
+        n //= p
+        k //= p
+    return result
+
 def show_calculation_process(n):
     """显示阶乘的计算过程"""
     if n < 0:
@@ -40,21 +172,36 @@ def show_calculation_process(n):
     
     return " × ".join(process) + f" = {result}"
 
+# 递归方法每层占一个栈帧，留出100层给调用方，在此范围内不会超出递归深度
+RECURSION_SAFE = sys.getrecursionlimit() - 100
+
 if __name__ == '__main__':
     try:
         n = int(input('请输入要计算阶乘的数：'))
         
-        # 使用递归方法
-        result1 = factorial_recursive(n)
-        print(f"\n递归方法计算 {n}! = {result1}")
+        if n <= RECURSION_SAFE:
+            # 使用递归方法
+            result1 = factorial_recursive(n)
+            print(f"\n递归方法计算 {n}! = {result1}")
+            
+            # 使用迭代方法
+            result2 = factorial_iterative(n)
+            print(f"迭代方法计算 {n}! = {result2}")
+        
+        # 使用素数摆动法
+        result3 = factorial_prime_swing(n)
+        if result3.bit_length() < 10000:
+            print(f"素数摆动法计算 {n}! = {result3}")
+        else:
+            print(f"素数摆动法计算 {n}! 共 {int(result3.bit_length() * 0.30103) + 1} 位左右")
         
-        # 使用迭代方法
-        result2 = factorial_iterative(n)
-        print(f"迭代方法计算 {n}! = {result2}")
+        p = 10 ** 9 + 7
+        print(f"{n}! mod {p} = {factorial_mod(n, p)}")
         
         # 显示计算过程
-        print(f"\n计算过程：")
-        print(f"{n}! = {show_calculation_process(n)}")
+        if n <= 20:
+            print(f"\n计算过程：")
+            print(f"{n}! = {show_calculation_process(n)}")
         
     except ValueError as e:
-        print(f"错误：{str(e)}") 
\ No newline at end of file
+        print(f"错误：{str(e)}")
@@ -8,26 +8,62 @@
 1. 使用递归方式反向打印字符串
 2. 同时提供非递归方式作为对比
 3. 处理输入验证和异常情况
+4. 递归函数改为在显式栈上执行（公共模块 trampoline），可处理百万长度的字符串；字节数据可用bytearray原地反转
 """
 
+from trampoline import trampoline
+
+SLICE_THRESHOLD = 64  # 不超过此长度的片段直接切片反转
+
+@trampoline
 def reverse_string_recursive(s):
-    """递归方式反向打印字符串"""
-    if len(s) <= 1:
-        return s
-    return reverse_string_recursive(s[1:]) + s[0]
+    """递归方式反转字符串：后半部分的反转 + 前半部分的反转
+    
+    每次对半拆分，总复制量O(n log n)；在显式栈上执行，长字符串也不会超出递归深度；
+    拆到足够短时直接切片反转，减少调用次数
+    """
+    if len(s) <= SLICE_THRESHOLD:
+        return s[::-1]
+    mid = len(s) // 2
+    right = yield reverse_string_recursive.call(s[mid:])
+    left = yield reverse_string_recursive.call(s[:mid])
+    return right + left
+
+@trampoline
+def _reverse_tail(s, i, parts):
+    """尾递归：从后往前逐个收集字符"""
+    if i < 0:
+        return ''.join(parts)
+    parts.append(s[i])
+    return _reverse_tail.call(s, i - 1, parts)
+
+def reverse_string_tail(s):
+    """尾递归方式反转字符串，栈空间为O(1)"""
+    return _reverse_tail(s, len(s) - 1, [])
 
 def reverse_string_iterative(s):
     """迭代方式反向打印字符串"""
     return s[::-1]
 
+def reverse_bytes(data):
+    """原地反转字节数据：bytearray直接reverse，不产生中间字符串
+    
+    按字节反转，适用于二进制数据或单字节编码的文本（UTF-8多字节字符会被拆开）
+    """
+    if not isinstance(data, bytearray):
+        data = bytearray(data)
+    data.reverse()
+    return data
+
+@trampoline
 def print_reverse_process(s):
-    """打印递归过程"""
+    """打印递归过程：每层去掉首字符递归，返回时把首字符接到末尾"""
     if len(s) <= 1:
         print(f"基本情况: '{s}'")
         return s
     
     print(f"处理: '{s}' -> 递归处理 '{s[1:]}' + '{s[0]}'")
-    result = reverse_string_recursive(s[1:]) + s[0]
+    result = (yield print_reverse_process.call(s[1:])) + s[0]
     print(f"返回: '{result}'")
     return result
 
@@ -43,5 +79,6 @@ if __name__ == '__main__':
     result2 = reverse_string_iterative(text)
     print(f"结果：{result2}")
     
-    print("\n递归过程演示：")
-    print_reverse_process(text) 
\ No newline at end of file
+    if len(text) <= 20:
+        print("\n递归过程演示：")
+        print_reverse_process(text) 
\ No newline at end of file
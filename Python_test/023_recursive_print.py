@@ -11,13 +11,28 @@
 1. 利用递归的思维解决问题
 2. 同时提供迭代的解法
 3. 扩展问题规模，使其能处理n个人的情况
+4. 递归函数改为在显式栈上执行（公共模块 trampoline），n很大时也不会超出递归深度
 """
 
+from trampoline import trampoline
+
+@trampoline
 def age_recursive(n):
-    """递归方式计算第n个人的年龄"""
+    """递归方式计算第n个人的年龄（在显式栈上执行，不受递归深度限制）"""
+    if n < 1:
+        raise ValueError("人数必须为正整数！")
     if n == 1:
         return 10
-    return age_recursive(n - 1) + 2
+    return (yield age_recursive.call(n - 1)) + 2
+
+@trampoline
+def age_tail(n, age=10):
+    """尾递归方式计算第n个人的年龄，栈空间为O(1)"""
+    if n < 1:
+        raise ValueError("人数必须为正整数！")
+    if n == 1:
+        return age
+    return age_tail.call(n - 1, age + 2)
 
 def age_iterative(n):
     """迭代方式计算第n个人的年龄"""
@@ -55,8 +70,9 @@ if __name__ == '__main__':
             print(f"迭代方法计算第{n}个人的年龄：{result2}岁")
             
             # 打印计算过程
-            print("\n详细计算过程：")
-            print_age_calculation(n)
+            if n <= 20:
+                print("\n详细计算过程：")
+                print_age_calculation(n)
             
     except ValueError:
         print("请输入有效的整数！") 
\ No newline at end of file
@@ -8,8 +8,17 @@
 1. 首先判断此数是否大于最后一个数，然后再考虑插入中间的数的情况
 2. 需要考虑插入数据的时间复杂度
 3. 实现多种插入方法并比较性能
+4. 批量插入：先排序这批数再与原数组归并一次，O(n + k log k)；也支持NumPy数组
+5. 频繁插入时使用分块有序表，每次只移动一个小块
 """
 
+from bisect import bisect_left, bisect_right, insort
+
+try:
+    import numpy as np
+except ImportError:  # 没有NumPy时只支持列表
+    np = None
+
 def insert_sorted_simple(arr, num):
     """简单插入方法"""
     arr = arr.copy()  # 不修改原数组
@@ -39,6 +48,131 @@ def insert_sorted_binary(arr, num):
     pos = binary_search(arr, num, 0, len(arr)-1)
     return arr[:pos] + [num] + arr[pos:]
 
+def insert_many(sorted_arr, values):
+    """一次插入一批数，返回新的有序数组，O(n + k log k)
+    
+    NumPy数组：searchsorted一次求出所有插入位置，再用np.insert整体插入；
+    列表：先把这批数排好序接在后面，Timsort识别出两段有序序列后只做一次线性归并
+    """
+    if np is not None and isinstance(sorted_arr, np.ndarray):
+        values = np.sort(np.asarray(values, dtype=sorted_arr.dtype))
+        return np.insert(sorted_arr, np.searchsorted(sorted_arr, values, side='right'), values)
+    result = list(sorted_arr)
+    result.extend(sorted(values))
+    result.sort()
+    return result
+
+class SortedBlockList:
+    """分块有序表：数据分成若干个有序小块，另存每块的最大值用于二分定位
+    
+    插入时只移动一个块内的元素（块长约为sqrt(n)量级），块过长时一分为二，
+    频繁插入时每次O(log n + 块长)，不必移动整个数组
+    """
+    def __init__(self, iterable=(), block_size=512):
+        if block_size <= 0:
+            raise ValueError("块大小必须为正数！")
+        self.block_size = block_size
+        self.blocks = []  # 各个有序块
+        self.maxes = []   # 每块的最大值
+        self.size = 0
+        self.update(iterable)
+    
+    def _rebuild(self, values):
+        """由有序序列重新切分成块"""
+        size = self.block_size
+        self.blocks = [values[i:i + size] for i in range(0, len(values), size)]
+        self.maxes = [block[-1] for block in self.blocks]
+        self.size = len(values)
+    
+    def add(self, value):
+        """插入一个数"""
+        if not self.blocks:
+            self.blocks.append([value])
+            self.maxes.append(value)
+            self.size = 1
+            return
+        i = bisect_right(self.maxes, value)
+        if i == len(self.blocks):
+            # 比所有数都大，放进最后一块
+            i -= 1
+            self.blocks[i].append(value)
+            self.maxes[i] = value
+        else:
+            insort(self.blocks[i], value)
+        self.size += 1
+        block = self.blocks[i]
+        if len(block) > 2 * self.block_size:
+            # 块过长时一分为二
+            half = len(block) // 2
+            self.blocks[i:i + 1] = [block[:half], block[half:]]
+            self.maxes[i:i + 1] = [block[half - 1], block[-1]]
+    
+    def update(self, values):
+        """批量插入：这批数较多时与现有数据归并后重新分块"""
+        values = list(values)
+        if len(values) * 4 >= self.size:
+            self._rebuild(insert_many(list(self), values))
+        else:
+            for value in values:
+                self.add(value)
+    
+    def _locate(self, index):
+        """把全局下标转换为(块号, 块内下标)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("下标越界！")
+        for i, block in enumerate(self.blocks):
+            if index < len(block):
+                return i, index
+            index -= len(block)
+    
+    def remove(self, value):
+        """删除一个等于value的数，不存在时抛出ValueError"""
+        i = bisect_left(self.maxes, value)
+        if i == len(self.blocks):
+            raise ValueError(f"{value} 不在表中！")
+        block = self.blocks[i]
+        j = bisect_left(block, value)
+        if block[j] != value:
+            raise ValueError(f"{value} 不在表中！")
+        del block[j]
+        self.size -= 1
+        if block:
+            self.maxes[i] = block[-1]
+        else:
+            del self.blocks[i]
+            del self.maxes[i]
+    
+    def bisect_left(self, value):
+        """value在整个表中的插入位置（相等元素之前）"""
+        i = bisect_left(self.maxes, value)
+        offset = sum(len(block) for block in self.blocks[:i])
+        if i == len(self.blocks):
+            return offset
+        return offset + bisect_left(self.blocks[i], value)
+    
+    def __contains__(self, value):
+        i = bisect_left(self.maxes, value)
+        if i == len(self.blocks):
+            return False
+        block = self.blocks[i]
+        return block[bisect_left(block, value)] == value
+    
+    def __getitem__(self, index):
+        i, j = self._locate(index)
+        return self.blocks[i][j]
+    
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block
+    
+    def __len__(self):
+        return self.size
+    
+    def __repr__(self):
+        return f"SortedBlockList({list(self)})"
+
 def compare_methods(arr, num):
     """比较不同插入方法的结果"""
     import time
@@ -73,5 +207,13 @@ if __name__ == '__main__':
         print(f"结果：{result2}")
         print(f"耗时：{time2:.8f}秒")
         
+        values = [int(x) for x in input("\n请输入要批量插入的数字（空格分隔）：").split()]
+        print(f"批量插入结果：{insert_many(test_array, values)}")
+        
+        blocks = SortedBlockList(test_array, block_size=4)
+        for value in values:
+            blocks.add(value)
+        print(f"分块有序表：{list(blocks)}，共{len(blocks.blocks)}块")
+        
     except ValueError:
         print("请输入有效的数字！") 
\ No newline at end of file
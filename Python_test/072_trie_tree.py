@@ -9,9 +9,11 @@
 2. 实现字符串的插入和查找
 3. 实现前缀匹配功能
 4. 支持字符串删除操作
+5. 支持基数树（合并单孩子链）与按分数的前缀补全top-k
 """
 
-from typing import List, Dict, Optional
+import heapq
+from typing import List, Dict, Optional, Iterator, Iterable, Tuple
 
 class TrieNode:
     def __init__(self):
@@ -95,24 +97,160 @@ class Trie:
             return True
         return False
     
-    def get_words_with_prefix(self, prefix: str) -> List[str]:
-        """获取所有指定前缀的单词"""
-        result = []
+    def iter_words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """按字典序逐个产出指定前缀的单词（显式栈，不递归）"""
         node = self._find_node(prefix)
-        
         if not node:
-            return result
+            return
         
-        def _collect_words(node: TrieNode, current: str):
+        stack = [(node, prefix)]
+        while stack:
+            node, current = stack.pop()
             if node.is_end:
-                result.append(current)
-                self.steps.append((current, "收集单词"))
+                yield current
+            # 逆序压栈，保证按字典序弹出
+            for char in sorted(node.children, reverse=True):
+                stack.append((node.children[char], current + char))
+    
+    def get_words_with_prefix(self, prefix: str) -> List[str]:
+        """获取所有指定前缀的单词"""
+        result = []
+        for word in self.iter_words_with_prefix(prefix):
+            result.append(word)
+            self.steps.append((word, "收集单词"))
+        return result
+
+class RadixNode:
+    __slots__ = ('label', 'children', 'is_end', 'score', 'max_score')
+    
+    def __init__(self, label: str = ""):
+        self.label = label         # 入边上的字符串（压缩后的单孩子链）
+        self.children: Dict[str, RadixNode] = {}  # 首字符 -> 子节点
+        self.is_end = False        # 是否为单词结尾
+        self.score = 0             # 单词的分数（如词频）
+        self.max_score = float('-inf')  # 子树中单词的最大分数
+
+class RadixTrie:
+    """基数树（Patricia树）：合并单孩子链，每个节点记录子树最大分数，用于前缀补全top-k"""
+    def __init__(self):
+        self.root = RadixNode()
+        self.size = 0  # 单词数量
+    
+    @classmethod
+    def from_words(cls, words: Iterable[Tuple[str, float]]) -> 'RadixTrie':
+        """由(单词, 分数)批量构建"""
+        tree = cls()
+        for word, score in words:
+            tree.insert(word, score)
+        return tree
+    
+    def insert(self, word: str, score: float = 0) -> None:
+        """插入单词；单词已存在时更新分数"""
+        node = self.root
+        path = [node]
+        i = 0
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None:
+                # 剩余部分整体作为一条边
+                child = RadixNode(word[i:])
+                node.children[word[i]] = child
+                node = child
+                path.append(node)
+                break
             
-            for char, child in node.children.items():
-                _collect_words(child, current + char)
+            # 计算与边标签的公共前缀长度
+            label = child.label
+            j = 0
+            while j < len(label) and i + j < len(word) and label[j] == word[i + j]:
+                j += 1
+            if j < len(label):
+                # 在边的中间分裂
+                middle = RadixNode(label[:j])
+                child.label = label[j:]
+                middle.children[child.label[0]] = child
+                middle.max_score = child.max_score
+                node.children[word[i]] = middle
+                child = middle
+            node = child
+            path.append(node)
+            i += j
+        
+        if not node.is_end:
+            self.size += 1
+        node.is_end = True
+        node.score = score
+        # 自底向上更新路径上的最大分数（分数可能变小，需要重新计算）
+        for node in reversed(path):
+            best = node.score if node.is_end else float('-inf')
+            for child in node.children.values():
+                best = max(best, child.max_score)
+            node.max_score = best
+    
+    def _locate(self, prefix: str) -> Optional[Tuple[RadixNode, str]]:
+        """找到前缀所在的节点，返回(节点, 节点对应的完整字符串)；前缀可能止于边的中间"""
+        node = self.root
+        current = ""
+        while len(current) < len(prefix):
+            child = node.children.get(prefix[len(current)])
+            if child is None:
+                return None
+            rest = prefix[len(current):len(current) + len(child.label)]
+            if not child.label.startswith(rest):
+                return None
+            node = child
+            current += child.label
+        return node, current
+    
+    def search(self, word: str) -> bool:
+        """查找单词"""
+        found = self._locate(word)
+        return found is not None and found[1] == word and found[0].is_end
+    
+    def starts_with(self, prefix: str) -> bool:
+        """查找前缀"""
+        return self._locate(prefix) is not None
+    
+    def iter_words(self, prefix: str = "") -> Iterator[str]:
+        """按字典序逐个产出指定前缀的单词"""
+        found = self._locate(prefix)
+        if found is None:
+            return
+        stack = [found]
+        while stack:
+            node, current = stack.pop()
+            if node.is_end:
+                yield current
+            for char in sorted(node.children, reverse=True):
+                child = node.children[char]
+                stack.append((child, current + child.label))
+    
+    def top_k(self, prefix: str, k: int) -> List[Tuple[str, float]]:
+        """返回指定前缀下分数最高的k个单词
         
-        _collect_words(node, prefix)
+        以子树最大分数为优先级做最佳优先搜索，只展开可能进入前k的节点，不遍历整棵子树
+        """
+        found = self._locate(prefix)
+        if found is None or k <= 0:
+            return []
+        
+        node, current = found
+        # 堆元素：(-分数, 字符串, 是否为节点, 节点)；同分时按字典序
+        heap = [(-node.max_score, current, 1, node)]
+        result = []
+        while heap and len(result) < k:
+            neg_score, current, is_node, node = heapq.heappop(heap)
+            if not is_node:
+                result.append((current, -neg_score))
+                continue
+            if node.is_end:
+                heapq.heappush(heap, (-node.score, current, 0, node))
+            for child in node.children.values():
+                heapq.heappush(heap, (-child.max_score, current + child.label, 1, child))
         return result
+    
+    def __len__(self) -> int:
+        return self.size
 
 def print_operations(steps):
     """打印操作过程"""
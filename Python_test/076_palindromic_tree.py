@@ -9,107 +9,159 @@
 2. 实现回文子串的添加
 3. 实现回文子串的查询
 4. 支持最长回文子串查找
+5. 节点字段存放在并行数组中，快速链接保证添加字符摊还O(1)，支持整串批量构建与出现次数统计
 """
 
-from typing import List, Dict, Optional
-
-class PalindromeNode:
-    def __init__(self, start: int, length: int):
-        self.start = start      # 回文串起始位置
-        self.length = length    # 回文串长度
-        self.next = {}          # 转移边字典
-        self.suffix_link = None # 后缀链接
-        self.count = 0          # 出现次数
-        self.num = 0            # 不同回文后缀数量
+from array import array
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
 
 class PalindromicTree:
+    """回文树（eertree）：节点字段存放在并行数组中，节点0为虚拟根（长度-1），节点1为空串"""
     def __init__(self):
-        # 创建两个初始节点：空串和虚拟根
-        self.nodes = [PalindromeNode(0, -1), PalindromeNode(0, 0)]
-        self.text = ""
+        self.buffer = []                # 已添加的字符
+        self.length = array('i', [-1, 0])  # 回文串长度
+        self.link = array('i', [0, 0])     # 后缀链接：最长回文真后缀
+        self.quick = array('i', [0, 0])    # 快速链接：跳过前一个字符与link相同的后缀
+        self.end = array('i', [-1, -1])    # 首次出现的结束位置
+        self.count = array('i', [0, 0])    # 作为最长回文后缀出现的次数
+        self.num = array('i', [0, 0])      # 回文后缀数量（后缀链接深度）
+        self.edges = {}                 # 转移边：(节点 << 21) | 字符编码 -> 节点
         self.last = 1  # 上一个回文串的节点编号
         self.steps = []  # 记录操作步骤
     
-    def _get_suffix_link(self, node_idx: int) -> int:
-        """获取节点的后缀链接"""
-        while True:
-            cur_len = len(self.text) - 1
-            while cur_len - self.nodes[node_idx].length - 1 >= 0 and \
-                  self.text[cur_len - self.nodes[node_idx].length - 1] != self.text[cur_len]:
-                node_idx = self.nodes[node_idx].suffix_link
-            if cur_len - self.nodes[node_idx].length - 1 < 0:
-                return 0
-            if self.text[cur_len - self.nodes[node_idx].length - 1] == self.text[cur_len]:
-                break
-        return node_idx
+    @property
+    def text(self) -> str:
+        """已添加的文本"""
+        return ''.join(self.buffer)
     
-    def add_char(self, c: str) -> None:
-        """添加一个字符并更新回文树"""
-        self.text += c
-        pos = len(self.text) - 1
-        cur = self.last
+    def _get_suffix_link(self, node: int, i: int) -> int:
+        """沿后缀链接找到前一个字符等于buffer[i]的最长回文后缀
         
-        # 查找可以扩展的回文串
-        cur = self._get_suffix_link(cur)
+        前一个字符不匹配时，若link的前一个字符也不匹配，就沿快速链接一次跳过所有
+        前一个字符与link相同的后缀，每次添加字符的跳转次数为O(log n)
+        """
+        s, length, link = self.buffer, self.length, self.link
+        c = s[i]
+        while True:
+            j = i - length[node] - 1
+            if j >= 0 and s[j] == c:
+                return node
+            w = link[node]
+            j = i - length[w] - 1
+            if j >= 0 and s[j] == c or w == 0:
+                node = w
+            else:
+                node = self.quick[node]
+    
+    def _append(self, c: str) -> bool:
+        """添加一个字符，返回是否创建了新节点"""
+        self.buffer.append(c)
+        i = len(self.buffer) - 1
+        cur = self._get_suffix_link(self.last, i)
         
         # 检查是否已存在该转移
-        if c in self.nodes[cur].next:
-            self.last = self.nodes[cur].next[c]
-            self.nodes[self.last].count += 1
-            self.steps.append((c, "更新已有回文串"))
-            return
+        key = (cur << 21) | ord(c)
+        node = self.edges.get(key)
+        if node is not None:
+            self.last = node
+            self.count[node] += 1
+            return False
         
         # 创建新节点
-        new_node = PalindromeNode(pos - self.nodes[cur].length - 1,
-                                 self.nodes[cur].length + 2)
-        self.nodes.append(new_node)
-        new_idx = len(self.nodes) - 1
-        self.nodes[cur].next[c] = new_idx
+        node = len(self.length)
+        new_len = self.length[cur] + 2
+        if new_len == 1:
+            suffix = 1
+        else:
+            suffix = self.edges[(self._get_suffix_link(self.link[cur], i) << 21) | ord(c)]
         
-        # 设置后缀链接
-        if new_node.length == 1:
-            new_node.suffix_link = 1
-            new_node.num = 1
+        # 快速链接：比较suffix与其后缀链接前面的字符
+        if self.length[suffix] <= 0:
+            quick = 0
+        elif self.buffer[i - self.length[suffix]] == self.buffer[i - self.length[self.link[suffix]]]:
+            quick = self.quick[suffix]
         else:
-            cur = self._get_suffix_link(self.nodes[cur].suffix_link)
-            new_node.suffix_link = self.nodes[cur].next[c]
-            new_node.num = self.nodes[new_node.suffix_link].num + 1
+            quick = self.link[suffix]
         
-        new_node.count = 1
-        self.last = new_idx
-        self.steps.append((c, "创建新回文串"))
+        self.length.append(new_len)
+        self.link.append(suffix)
+        self.quick.append(quick)
+        self.end.append(i)
+        self.count.append(1)
+        self.num.append(self.num[suffix] + 1)
+        self.edges[key] = node
+        self.last = node
+        return True
     
-    def get_palindromes(self) -> List[str]:
-        """获取所有回文子串"""
+    def add_char(self, c: str) -> None:
+        """添加一个字符并更新回文树"""
+        if self._append(c):
+            self.steps.append((c, "创建新回文串"))
+        else:
+            self.steps.append((c, "更新已有回文串"))
+    
+    def extend(self, chars: Iterable[str]) -> None:
+        """批量添加字符（不记录操作步骤），可多次调用以处理流式到达的文本"""
+        append = self._append
+        for c in chars:
+            append(c)
+    
+    @classmethod
+    def from_string(cls, text: str) -> 'PalindromicTree':
+        """由整个字符串批量构建回文树"""
+        tree = cls()
+        tree.extend(text)
+        return tree
+    
+    def occurrences(self) -> array:
+        """各节点回文串的出现次数：按创建的逆序把次数累加到后缀链接"""
+        occ = array('i', self.count)
+        for node in range(len(occ) - 1, 1, -1):
+            occ[self.link[node]] += occ[node]
+        return occ
+    
+    def palindrome_spans(self) -> Iterator[Tuple[int, int, int]]:
+        """产出每个不同回文子串的(首次出现起点, 长度, 出现次数)，不切片字符串"""
+        occ = self.occurrences()
+        for node in range(2, len(self.length)):
+            yield self.end[node] - self.length[node] + 1, self.length[node], occ[node]
+    
+    def get_palindromes(self) -> List[Tuple[str, int]]:
+        """获取所有回文子串及其出现次数"""
+        text = self.text
         result = []
-        for node in self.nodes[2:]:  # 跳过两个初始节点
-            if node.length > 0:
-                palindrome = self.text[node.start:node.start + node.length]
-                result.append((palindrome, node.count))
-                self.steps.append((palindrome, "收集回文串"))
+        for start, length, count in self.palindrome_spans():
+            palindrome = text[start:start + length]
+            result.append((palindrome, count))
+            self.steps.append((palindrome, "收集回文串"))
         return result
     
     def find_longest_palindrome(self) -> str:
         """查找最长回文子串"""
         max_len = 0
-        result = ""
+        best = 1
         
-        for node in self.nodes[2:]:  # 跳过两个初始节点
-            if node.length > max_len:
-                max_len = node.length
-                result = self.text[node.start:node.start + node.length]
-                self.steps.append((result, "更新最长回文串"))
+        for node in range(2, len(self.length)):  # 跳过两个初始节点
+            if self.length[node] > max_len:
+                max_len = self.length[node]
+                best = node
         
+        if max_len == 0:
+            return ""
+        start = self.end[best] - max_len + 1
+        result = ''.join(self.buffer[start:start + max_len])
+        self.steps.append((result, "更新最长回文串"))
         return result
     
     def count_different_palindromes(self) -> int:
         """统计不同回文子串的数量"""
-        count = 0
-        for node in self.nodes[2:]:  # 跳过两个初始节点
-            if node.length > 0:
-                count += 1
+        count = len(self.length) - 2  # 除两个初始节点外每个节点对应一个回文串
         self.steps.append((count, "统计回文串数量"))
         return count
+    
+    def count_all_palindromes(self) -> int:
+        """统计回文子串总数（按出现位置计）：每个位置的回文后缀数量之和"""
+        return sum(self.occurrences()[2:])
 
 def print_operations(steps):
     """打印操作过程"""
@@ -5,57 +5,122 @@
 题目：实现Manacher算法及其应用。
 
 程序分析：
-1. 实现字符串预处理
-2. 实现回文半径数组构建
+1. 虚拟插入分隔符，不构造预处理字符串
+2. 实现回文半径数组构建（array存储）
 3. 实现最长回文子串查找
 4. 支持所有回文子串统计
+5. 支持O(1)判断任意区间是否为回文串（可批量查询）
+6. 惰性枚举本质不同的回文子串
 """
 
-from typing import List, Tuple
+from array import array
+from typing import List, Tuple, Iterable, Iterator
+
+MOD = (1 << 61) - 1  # 子串哈希的模数，用于回文串去重
+BASE = 911382323
 
 class Manacher:
-    def __init__(self, text: str):
+    def __init__(self, text: str, record_steps: bool = True):
         self.original = text
-        self.processed = self._preprocess(text)
-        self.n = len(self.processed)
-        self.radius = [0] * self.n  # 回文半径数组
+        self.n = 2 * len(text) + 1  # 虚拟插入分隔符后的长度
+        self.radius = array('i', [0]) * self.n  # 回文半径数组
+        self.record_steps = record_steps  # 处理超长文本时可关闭操作记录
         self.steps = []  # 记录操作步骤
+        self._prefix_hash = None  # 前缀哈希，首次去重时才构建
         self._build_radius_array()
     
-    def _preprocess(self, s: str) -> str:
-        """预处理字符串，在字符间插入特殊字符"""
-        processed = ['#']
-        for c in s:
-            processed.extend([c, '#'])
-        result = ''.join(processed)
-        self.steps.append((result, "预处理字符串"))
-        return result
-    
     def _build_radius_array(self) -> None:
-        """构建回文半径数组"""
+        """构建回文半径数组
+        
+        不真正构造插入'#'后的字符串：下标p为奇数时对应原串字符text[p // 2]，
+        为偶数时对应分隔符。对称位置奇偶性相同，分隔符总是相等，只需比较原串字符
+        """
+        text, radius, n = self.original, self.radius, self.n
         center = 0      # 当前回文串的中心
         right = 0      # 当前回文串的右边界
         
-        for i in range(self.n):
+        for i in range(n):
+            r = 0
             if i < right:
                 # 利用对称性进行优化
-                mirror = 2 * center - i
-                self.radius[i] = min(right - i, self.radius[mirror])
+                r = min(right - i, radius[2 * center - i])
             
             # 尝试扩展回文串
-            left = i - (self.radius[i] + 1)
-            r = i + (self.radius[i] + 1)
-            
-            while left >= 0 and r < self.n and self.processed[left] == self.processed[r]:
-                self.radius[i] += 1
-                left -= 1
+            left, rr = i - r - 1, i + r + 1
+            while left >= 0 and rr < n and (left % 2 == 0 or text[left // 2] == text[rr // 2]):
                 r += 1
+                left -= 1
+                rr += 1
+            radius[i] = r
             
             # 更新中心和右边界
-            if i + self.radius[i] > right:
+            if i + r > right:
                 center = i
-                right = i + self.radius[i]
-                self.steps.append((i, self.radius[i], "更新回文中心"))
+                right = i + r
+                if self.record_steps:
+                    self.steps.append((i, r, "更新回文中心"))
+    
+    def is_palindrome(self, l: int, r: int) -> bool:
+        """O(1)判断原串闭区间[l, r]是否为回文串"""
+        if not 0 <= l <= r < len(self.original):
+            raise ValueError("区间越界！")
+        return self.radius[l + r + 1] >= r - l + 1
+    
+    def batch_is_palindrome(self, queries: Iterable[Tuple[int, int]]) -> List[bool]:
+        """批量判断多个闭区间是否为回文串，每个查询O(1)"""
+        radius, size = self.radius, len(self.original)
+        result = []
+        for l, r in queries:
+            if not 0 <= l <= r < size:
+                raise ValueError("区间越界！")
+            result.append(radius[l + r + 1] >= r - l + 1)
+        return result
+    
+    def _substring_hash(self, start: int, length: int) -> int:
+        """原串子串的多项式哈希"""
+        if self._prefix_hash is None:
+            prefix = array('q', [0]) * (len(self.original) + 1)
+            power = array('q', [1]) * (len(self.original) + 1)
+            for i, c in enumerate(self.original):
+                prefix[i + 1] = (prefix[i] * BASE + ord(c)) % MOD
+                power[i + 1] = power[i] * BASE % MOD
+            self._prefix_hash = (prefix, power)
+        prefix, power = self._prefix_hash
+        return (prefix[start + length] - prefix[start] * power[length]) % MOD
+    
+    def _distinct_palindromes(self) -> Iterator[Tuple[int, int]]:
+        """按首次出现的结束位置产出所有本质不同的回文子串(起点, 长度)
+        
+        每个新回文串首次出现时一定是该前缀的最长回文后缀，也就是右边界第一次
+        到达该位置时的回文中心所对应的回文串，因此每个结束位置只需检查一次
+        """
+        seen = set()
+        right = -1
+        for i, r in enumerate(self.radius):
+            reach = i + r
+            if reach <= right:
+                continue
+            # 右边界推进经过的每个原串字符位置e（奇数下标）
+            for e in range((right + 1) | 1, reach + 1, 2):
+                length = e - i + 1
+                start = (e - 1) // 2 - length + 1
+                key = (self._substring_hash(start, length), length)
+                if key not in seen:
+                    seen.add(key)
+                    yield start, length
+            right = reach
+    
+    def iter_palindromes(self) -> Iterator[str]:
+        """惰性产出所有本质不同的回文子串（按首次出现的结束位置排序）"""
+        for start, length in self._distinct_palindromes():
+            yield self.original[start:start + length]
+    
+    def count_distinct_palindromes(self) -> int:
+        """统计本质不同的回文子串数量，线性时间"""
+        count = sum(1 for _ in self._distinct_palindromes())
+        if self.record_steps:
+            self.steps.append((count, "统计本质不同回文子串"))
+        return count
     
     def find_longest_palindrome(self) -> str:
         """查找最长回文子串"""
@@ -66,7 +131,8 @@ class Manacher:
             if self.radius[i] > max_len:
                 max_len = self.radius[i]
                 center = i
-                self.steps.append((max_len, "更新最长回文串"))
+                if self.record_steps:
+                    self.steps.append((max_len, "更新最长回文串"))
         
         # 还原原始字符串中的回文子串
         start = (center - max_len) // 2
@@ -75,28 +141,32 @@ class Manacher:
         return result
     
     def count_all_palindromes(self) -> List[Tuple[str, int]]:
-        """统计所有回文子串及其出现次数"""
-        palindromes = {}
+        """统计所有回文子串及其出现次数
         
-        for i in range(self.n):
-            for length in range(self.radius[i] + 1):
-                if length == 0:
-                    continue
-                
-                # 计算在原始字符串中的位置和长度
-                start = (i - length) // 2
-                if length % 2 == 0:
-                    actual_len = length // 2
-                else:
-                    actual_len = (length + 1) // 2
-                
-                if start >= 0 and start + actual_len <= len(self.original):
-                    palindrome = self.original[start:start + actual_len]
-                    if palindrome:
-                        palindromes[palindrome] = palindromes.get(palindrome, 0) + 1
-                        self.steps.append((palindrome, "发现回文串"))
+        每个中心的最长回文串计1次，再按长度从长到短把次数累加到去掉首尾字符的内层回文串，
+        只在本质不同的回文串上计算，不枚举每个半径
+        """
+        counts = {}  # (哈希, 长度) -> [起点, 长度, 出现次数]
+        for start, length in self._distinct_palindromes():
+            counts[(self._substring_hash(start, length), length)] = [start, length, 0]
+        
+        for i, r in enumerate(self.radius):
+            if r:
+                start = (i - r) // 2
+                counts[(self._substring_hash(start, r), r)][2] += 1
+        
+        for start, length, count in sorted(counts.values(), key=lambda item: -item[1]):
+            if length > 2:
+                counts[(self._substring_hash(start + 1, length - 2), length - 2)][2] += count
         
-        return sorted(palindromes.items(), key=lambda x: (-len(x[0]), x[0]))
+        palindromes = []
+        for start, length, count in counts.values():
+            palindrome = self.original[start:start + length]
+            palindromes.append((palindrome, count))
+            if self.record_steps:
+                self.steps.append((palindrome, "发现回文串"))
+        
+        return sorted(palindromes, key=lambda x: (-len(x[0]), x[0]))
     
     def count_palindrome_substrings(self) -> int:
         """计算回文子串的总数"""
@@ -113,13 +183,11 @@ def print_operations(steps):
         print(f"\n第{i}步：")
         if len(step) == 2:
             val, operation = step
-            if operation == "预处理字符串":
-                print(f"{operation}：'{val}'")
-            elif operation == "更新最长回文串":
+            if operation == "更新最长回文串":
                 print(f"{operation}：长度 {val}")
             elif operation == "发现回文串":
                 print(f"{operation}：'{val}'")
-            elif operation == "统计回文子串数量":
+            elif operation in ["统计回文子串数量", "统计本质不同回文子串"]:
                 print(f"{operation}：{val}")
         elif len(step) == 3:
             pos, rad, operation = step
@@ -141,9 +209,10 @@ if __name__ == '__main__':
             print("1. 查找最长回文子串")
             print("2. 查看所有回文子串")
             print("3. 统计回文子串数量")
-            print("4. 退出")
+            print("4. 判断区间是否为回文串")
+            print("5. 退出")
             
-            choice = input("请输入选择（1-4）：")
+            choice = input("请输入选择（1-5）：")
             
             if choice == '1':
                 result = manacher.find_longest_palindrome()
@@ -161,8 +230,19 @@ if __name__ == '__main__':
             elif choice == '3':
                 count = manacher.count_palindrome_substrings()
                 print(f"\n回文子串的总数为：{count}")
+                print(f"本质不同的回文子串数为：{manacher.count_distinct_palindromes()}")
             
             elif choice == '4':
+                try:
+                    l, r = map(int, input("请输入区间的起点和终点（空格分隔，从0开始）：").split())
+                    if manacher.is_palindrome(l, r):
+                        print(f"\n'{text[l:r + 1]}' 是回文串")
+                    else:
+                        print(f"\n'{text[l:r + 1]}' 不是回文串")
+                except ValueError as e:
+                    print(f"错误：{str(e)}")
+            
+            elif choice == '5':
                 break
             
             else:
@@ -9,24 +9,31 @@
 2. 实现字符串匹配
 3. 支持多模式串匹配
 4. 实现循环节查找
+5. 支持字节模式，直接扫描bytes/memoryview/mmap
+6. 支持compile()预编译模式串，缓存预处理结果供重复搜索
+7. 支持流式匹配（KMPStream），前缀函数与Z函数结果缓存复用
 """
 
-from typing import List, Dict, Set, Optional
+from array import array
+from functools import lru_cache
+from typing import List, Dict, Set, Optional, Tuple, Iterable, Iterator
+
+from parallel_search import byte_view
 
 class KMP:
     def __init__(self):
         self.steps = []  # 记录操作步骤
     
     def build_next(self, pattern: str) -> List[int]:
-        """构建next数组"""
+        """构建next数组（多算一位，next_array[n]为整个模式串的最长公共前后缀长度）"""
         n = len(pattern)
-        next_array = [0] * n
+        next_array = [0] * (n + 1)
         next_array[0] = -1
         
         k = -1  # 前缀末尾
         j = 0   # 后缀末尾
         
-        while j < n - 1:
+        while j < n:
             if k == -1 or pattern[k] == pattern[j]:
                 k += 1
                 j += 1
@@ -60,7 +67,7 @@ class KMP:
             
             if j == len(pattern):
                 positions.append(i - j)
-                j = next_array[j-1]
+                j = next_array[j]
                 self.steps.append((i-j, "找到匹配"))
         
         return positions
@@ -69,28 +76,149 @@ class KMP:
         """多模式串匹配"""
         result = {}
         for pattern in patterns:
-            positions = self.search(text, pattern)
+            positions = compile(pattern).search(text)
             if positions:
                 result[pattern] = positions
                 self.steps.append((pattern, len(positions), "模式串匹配结果"))
         return result
     
     def find_period(self, pattern: str) -> Optional[int]:
-        """查找字符串的最小循环节长度"""
-        next_array = self.build_next(pattern)
+        """查找字符串的最小循环节长度（复用缓存的前缀函数）"""
         n = len(pattern)
-        
         if n == 0:
             return None
         
-        # 如果字符串长度可以被(n - next_array[-1])整除，则存在循环节
-        if next_array[-1] > 0 and n % (n - next_array[-1]) == 0:
-            period = n - next_array[-1]
+        # 如果字符串长度可以被(n - 最长公共前后缀长度)整除，则存在循环节
+        border = prefix_function(pattern)[-1]
+        if border > 0 and n % (n - border) == 0:
+            period = n - border
             self.steps.append((period, "找到循环节"))
             return period
         
         self.steps.append(("未找到循环节",))
         return None
+    
+    def find_all_periods(self, pattern: str) -> List[int]:
+        """查找字符串的所有周期p（pattern[i] == pattern[i+p]），利用缓存的Z函数"""
+        n = len(pattern)
+        z = z_function(pattern)
+        return [p for p in range(1, n) if z[p] == n - p] + ([n] if n else [])
+    
+    def search_bytes(self, data, pattern: bytes) -> List[int]:
+        """字节模式：直接在bytes/bytearray/memoryview/mmap上搜索（不解码，不记录操作步骤）"""
+        if not pattern or not len(data):
+            return []
+        return compile(pattern).search(data)
+
+class CompiledKMP:
+    """预处理好的KMP模式串（不可变），由compile()创建，可在多个文本上重复使用"""
+    __slots__ = ('pattern', '_fail')
+    
+    def __init__(self, pattern):
+        # fail[j]为pattern[:j+1]的最长公共前后缀长度
+        object.__setattr__(self, 'pattern', pattern)
+        object.__setattr__(self, '_fail', array('i', prefix_function(pattern)))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledKMP对象不可修改")
+    
+    def __repr__(self):
+        return f"CompiledKMP({self.pattern!r})"
+    
+    def search(self, text) -> List[int]:
+        """在文本中搜索，返回所有匹配位置；str模式串搜str，bytes模式串搜字节序列"""
+        return self.scan(text)[0]
+    
+    def scan(self, text, state: int = 0, offset: int = 0) -> Tuple[List[int], int, int]:
+        """从匹配状态state继续扫描一段文本，返回(匹配位置, 新状态, 扫描的字符数)
+        
+        state为已匹配的模式串前缀长度，offset为这段文本在整个输入中的起点，
+        文本可以是任意字符（或字节）的可迭代对象
+        """
+        text = byte_view(text)
+        pattern, fail = self.pattern, self._fail
+        m = len(pattern)
+        positions = []
+        j = state
+        i = -1
+        for i, c in enumerate(text):
+            while j and c != pattern[j]:
+                j = fail[j-1]
+            if c == pattern[j]:
+                j += 1
+                if j == m:
+                    positions.append(offset + i - m + 1)
+                    j = fail[j-1]
+        return positions, j, i + 1
+
+@lru_cache(maxsize=256)
+def _compile(pattern) -> CompiledKMP:
+    return CompiledKMP(pattern)
+
+def compile(pattern) -> CompiledKMP:
+    """预处理模式串并缓存（类似re.compile），同一模式串重复搜索时跳过预处理"""
+    if isinstance(pattern, (bytearray, memoryview)):
+        pattern = bytes(pattern)
+    if not pattern:
+        raise ValueError("模式串不能为空！")
+    return _compile(pattern)
+
+@lru_cache(maxsize=256)
+def prefix_function(pattern) -> Tuple[int, ...]:
+    """前缀函数（缓存）：pi[j]为pattern[:j+1]的最长公共前后缀长度"""
+    m = len(pattern)
+    pi = [0] * m
+    k = 0
+    for j in range(1, m):
+        while k and pattern[j] != pattern[k]:
+            k = pi[k-1]
+        if pattern[j] == pattern[k]:
+            k += 1
+        pi[j] = k
+    return tuple(pi)
+
+@lru_cache(maxsize=256)
+def z_function(pattern) -> Tuple[int, ...]:
+    """Z函数（缓存）：z[i]为pattern与pattern[i:]的最长公共前缀长度，z[0]定义为len(pattern)"""
+    n = len(pattern)
+    z = [0] * n
+    if n:
+        z[0] = n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and pattern[z[i]] == pattern[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return tuple(z)
+
+class KMPStream:
+    """流式KMP匹配器：分块输入文本，逐块产出匹配位置，内存占用与文本长度无关
+    
+    可用于管道、网络流等无法一次读入的输入；模式串为str时输入字符，为bytes时输入字节
+    """
+    def __init__(self, pattern):
+        self.matcher = compile(pattern)
+        self.state = 0     # 已匹配的模式串前缀长度，跨块保留
+        self.position = 0  # 已消费的字符数
+    
+    def feed(self, chunk) -> List[int]:
+        """输入一块文本，返回在这块中完成的匹配的起点（相对整个输入）"""
+        positions, self.state, consumed = self.matcher.scan(chunk, self.state, self.position)
+        self.position += consumed
+        return positions
+    
+    def feed_all(self, chunks: Iterable) -> Iterator[int]:
+        """依次输入多块文本，逐个产出匹配位置"""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+    
+    def reset(self) -> None:
+        """重置为初始状态，开始匹配新的输入"""
+        self.state = 0
+        self.position = 0
 
 def print_operations(steps):
     """打印操作过程"""
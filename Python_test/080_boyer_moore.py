@@ -9,10 +9,16 @@
 2. 实现好后缀规则
 3. 实现字符串匹配
 4. 优化匹配过程
+5. 支持字节模式，直接扫描bytes/memoryview/mmap
+6. 支持compile()预编译模式串，缓存预处理结果供重复搜索
 """
 
+from array import array
+from functools import lru_cache
 from typing import List, Dict, Optional
 
+from parallel_search import byte_view
+
 class BoyerMoore:
     def __init__(self):
         self.steps = []  # 记录操作步骤
@@ -32,8 +38,8 @@ class BoyerMoore:
     def _build_good_suffix_table(self, pattern: str) -> tuple:
         """构建好后缀规则表"""
         n = len(pattern)
-        suffix = [0] * n
-        prefix = [False] * n
+        suffix = [-1] * n
+        prefix = [False] * (n + 1)
         
         # 计算后缀数组
         for i in range(n - 1):
@@ -94,18 +100,30 @@ class BoyerMoore:
         
         return positions
     
+    def multi_pattern_search(self, text: str, patterns: List[str]) -> Dict[str, List[int]]:
+        """多模式串匹配，每个模式串的规则表只在首次出现时构建"""
+        result = {}
+        for pattern in patterns:
+            positions = compile(pattern).search(text)
+            if positions:
+                result[pattern] = positions
+                self.steps.append((pattern, len(positions), "模式串匹配结果"))
+        return result
+    
     def _get_suffix_shift(self, j: int, suffix: List[int], prefix: List[bool], m: int) -> int:
         """计算好后缀规则的移动距离"""
         k = m - 1 - j  # 好后缀长度
         
-        if k > 0:
-            if suffix[k] > -1:
-                return j - suffix[k] + 1
-            
-            # 查找最长的可匹配前缀
-            for r in range(j+2, m):
-                if prefix[m-r]:
-                    return r
+        if k == 0:
+            return 0  # 没有好后缀，只使用坏字符规则
+        
+        if suffix[k] > -1:
+            return j - suffix[k] + 1
+        
+        # 查找最长的可匹配前缀
+        for r in range(j+2, m):
+            if prefix[m-r]:
+                return r
         
         return m
     
@@ -153,6 +171,89 @@ class BoyerMoore:
                 self.steps.append((shift, "Turbo移动"))
         
         return positions
+    
+    def search_bytes(self, data, pattern: bytes) -> List[int]:
+        """字节模式：直接在bytes/bytearray/memoryview/mmap上搜索（不解码，不记录操作步骤）"""
+        if not pattern or not len(data):
+            return []
+        return compile(pattern).search(data)
+
+class CompiledBoyerMoore:
+    """预处理好的Boyer-Moore模式串（不可变），由compile()创建，可在多个文本上重复使用"""
+    __slots__ = ('pattern', '_bad_char', '_good_suffix')
+    
+    def __init__(self, pattern):
+        m = len(pattern)
+        # 坏字符表：每个字符在模式串中最后出现的位置
+        # str模式串用字典存储，bytes模式串用256项数组，按字节值直接索引
+        if isinstance(pattern, bytes):
+            table = array('i', [-1]) * 256
+            bad_char = table.__getitem__
+        else:
+            table = {}
+            bad_char = lambda c: table.get(c, -1)
+        for i, c in enumerate(pattern):
+            table[c] = i
+        
+        # 好后缀表：suffix[k]为长度k的后缀在前面出现的起点，prefix[k]表示该后缀是否也是前缀
+        suffix = [-1] * (m + 1)
+        prefix = [False] * (m + 1)
+        for i in range(m - 1):
+            j, k = i, 0
+            while j >= 0 and pattern[j] == pattern[m-1-k]:
+                k += 1
+                suffix[k] = j
+                j -= 1
+            if j < 0:
+                prefix[k] = True
+        # 预先算出在位置j失配时好后缀规则的移动距离
+        good_suffix = array('i', [0]) * m
+        for j in range(m - 1):
+            k = m - 1 - j
+            if suffix[k] > -1:
+                good_suffix[j] = j - suffix[k] + 1
+            else:
+                good_suffix[j] = next((r for r in range(j + 2, m) if prefix[m-r]), m)
+        
+        object.__setattr__(self, 'pattern', pattern)
+        object.__setattr__(self, '_bad_char', bad_char)
+        object.__setattr__(self, '_good_suffix', good_suffix)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledBoyerMoore对象不可修改")
+    
+    def __repr__(self):
+        return f"CompiledBoyerMoore({self.pattern!r})"
+    
+    def search(self, text) -> List[int]:
+        """在文本中搜索，返回所有匹配位置；str模式串搜str，bytes模式串搜字节序列"""
+        text = byte_view(text)
+        pattern, bad_char, good_suffix = self.pattern, self._bad_char, self._good_suffix
+        n, m = len(text), len(pattern)
+        positions = []
+        i = 0
+        while i <= n - m:
+            j = m - 1
+            while j >= 0 and text[i+j] == pattern[j]:
+                j -= 1
+            if j < 0:
+                positions.append(i)
+                i += 1
+            else:
+                i += max(1, j - bad_char(text[i+j]), good_suffix[j])
+        return positions
+
+@lru_cache(maxsize=256)
+def _compile(pattern) -> CompiledBoyerMoore:
+    return CompiledBoyerMoore(pattern)
+
+def compile(pattern) -> CompiledBoyerMoore:
+    """预处理模式串并缓存（类似re.compile），同一模式串重复搜索时跳过预处理"""
+    if isinstance(pattern, (bytearray, memoryview)):
+        pattern = bytes(pattern)
+    if not pattern:
+        raise ValueError("模式串不能为空！")
+    return _compile(pattern)
 
 def print_operations(steps):
     """打印操作过程"""
@@ -175,6 +276,8 @@ def print_operations(steps):
                 print(f"{operation}：长度 {val1} 位置 {val2}")
             elif operation in ["字符匹配", "Turbo匹配", "常规匹配"]:
                 print(f"{operation}：文本位置 {val1} 模式串位置 {val2}")
+            elif operation == "模式串匹配结果":
+                print(f"{operation}：'{val1}' 找到 {val2} 处匹配")
 
 if __name__ == '__main__':
     try:
@@ -9,11 +9,17 @@
 2. 实现字符串匹配
 3. 支持多模式串匹配
 4. 优化匹配过程
+5. 支持字节模式，直接扫描bytes/memoryview/mmap
+6. 支持compile()预编译模式串，缓存预处理结果供重复搜索
 """
 
+from array import array
+from functools import lru_cache
 from typing import List, Dict, Set
 from collections import defaultdict
 
+from parallel_search import byte_view
+
 class Horspool:
     def __init__(self):
         self.steps = []  # 记录操作步骤
@@ -69,7 +75,7 @@ class Horspool:
         """多模式串匹配"""
         result = {}
         for pattern in patterns:
-            positions = self.search(text, pattern)
+            positions = compile(pattern).search(text)
             if positions:
                 result[pattern] = positions
                 self.steps.append((pattern, len(positions), "模式串匹配结果"))
@@ -119,6 +125,61 @@ class Horspool:
             self.steps.append((shift, "优化移动"))
         
         return positions
+    
+    def search_bytes(self, data, pattern: bytes) -> List[int]:
+        """字节模式：直接在bytes/bytearray/memoryview/mmap上搜索（不解码，不记录操作步骤）"""
+        if not pattern or not len(data):
+            return []
+        return compile(pattern).search(data)
+
+class CompiledHorspool:
+    """预处理好的Horspool模式串（不可变），由compile()创建，可在多个文本上重复使用"""
+    __slots__ = ('pattern', '_shift')
+    
+    def __init__(self, pattern):
+        m = len(pattern)
+        # str模式串用字典存储移动表，bytes模式串用256项数组，按字节值直接索引
+        if isinstance(pattern, bytes):
+            table = array('i', [m]) * 256
+            shift = table.__getitem__
+        else:
+            table = {}
+            shift = lambda c: table.get(c, m)
+        for i in range(m - 1):
+            table[pattern[i]] = m - 1 - i
+        object.__setattr__(self, 'pattern', pattern)
+        object.__setattr__(self, '_shift', shift)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledHorspool对象不可修改")
+    
+    def __repr__(self):
+        return f"CompiledHorspool({self.pattern!r})"
+    
+    def search(self, text) -> List[int]:
+        """在文本中搜索，返回所有匹配位置；str模式串搜str，bytes模式串搜字节序列"""
+        text = byte_view(text)
+        pattern, shift = self.pattern, self._shift
+        n, m = len(text), len(pattern)
+        positions = []
+        i = 0
+        while i <= n - m:
+            if text[i:i+m] == pattern:
+                positions.append(i)
+            i += shift(text[i+m-1])
+        return positions
+
+@lru_cache(maxsize=256)
+def _compile(pattern) -> CompiledHorspool:
+    return CompiledHorspool(pattern)
+
+def compile(pattern) -> CompiledHorspool:
+    """预处理模式串并缓存（类似re.compile），同一模式串重复搜索时跳过预处理"""
+    if isinstance(pattern, (bytearray, memoryview)):
+        pattern = bytes(pattern)
+    if not pattern:
+        raise ValueError("模式串不能为空！")
+    return _compile(pattern)
 
 def print_operations(steps):
     """打印操作过程"""
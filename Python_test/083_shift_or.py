@@ -7,13 +7,22 @@
 程序分析：
 1. 实现位向量构建
 2. 实现位运算匹配
-3. 支持模糊匹配
+3. 支持模糊匹配（Myers位并行编辑距离，公共模块 myers_distance，耗时与错误数无关）
 4. 优化匹配过程
+5. 支持字节模式，直接扫描bytes/memoryview/mmap
+6. 多模式串打包进同一宽位向量，一次扫描文本同时匹配（multi_pattern_search）
+7. search_blocks：用NumPy对所有起点逐列比较字符（公共模块 vector_search），
+   不是逐字符的位并行自动机，最坏O(n·m)，但随机文本上存活的起点很快变稀疏
 """
 
-from typing import List, Dict, Set
+from array import array
+from typing import List, Dict, Set, Tuple
 from collections import defaultdict
 
+import myers_distance
+import vector_search
+from parallel_search import byte_view
+
 class ShiftOr:
     def __init__(self):
         self.steps = []  # 记录操作步骤
@@ -54,42 +63,20 @@ class ShiftOr:
         
         return positions
     
-    def fuzzy_search(self, text: str, pattern: str, k: int) -> List[int]:
-        """支持k个错误的模糊匹配"""
-        if not pattern or not text or k < 0:
-            return []
-        
-        m = len(pattern)
-        mask = self._build_mask(pattern)
-        positions = []
-        
-        # 初始化k+1个状态，每个状态表示对应数量的错误
-        states = [(1 << m) - 1] * (k + 1)
-        
-        for i, c in enumerate(text):
-            old_states = states.copy()
-            
-            # 更新每个错误数量的状态
-            states[0] = ((old_states[0] << 1) | mask[c]) & ((1 << m) - 1)
-            self.steps.append((i, 0, bin(states[0]), "模糊匹配状态"))
-            
-            for j in range(1, k + 1):
-                # 允许j个错误的状态转移
-                substitution = ((old_states[j-1] << 1) | mask[c])  # 替换
-                deletion = (old_states[j] << 1) | 1                # 删除
-                insertion = old_states[j-1] << 1                   # 插入
-                
-                states[j] = (substitution & deletion & insertion) & ((1 << m) - 1)
-                self.steps.append((i, j, bin(states[j]), "错误状态更新"))
-            
-            # 检查所有状态是否有匹配
-            for j in range(k + 1):
-                if not (states[j] & (1 << (m - 1))):
-                    positions.append((i - m + 1, j))
-                    self.steps.append((i - m + 1, j, "找到模糊匹配"))
+    def fuzzy_search(self, text: str, pattern: str, k: int) -> List[Tuple[int, int]]:
+        """支持k个错误的模糊匹配，返回(结束位置, 编辑距离)列表
         
+        使用Myers位并行算法（公共模块 myers_distance），每个字符只做常数次大整数位运算，耗时与k无关
+        """
+        positions = myers_distance.fuzzy_search(text, pattern, k)
+        for j, score in positions:
+            self.steps.append((j, score, "找到模糊匹配"))
         return positions
     
+    def fuzzy_lookup(self, words: List[str], dictionary: List[str], k: int) -> Dict[str, List[Tuple[str, int]]]:
+        """批量模糊查词：为每个单词找出词典中编辑距离不超过k的词，按距离排序"""
+        return myers_distance.fuzzy_lookup(words, dictionary, k)
+    
     def optimize_search(self, text: str, pattern: str) -> List[int]:
         """优化的Shift-Or搜索算法"""
         if not pattern or not text:
@@ -119,6 +106,95 @@ class ShiftOr:
                     self.steps.append((pos - m + 1, "找到优化匹配"))
         
         return sorted(positions)
+    
+    def _build_packed_masks(self, patterns: List[str]) -> Tuple[Dict[str, int], int, int, Dict[int, str]]:
+        """把多个模式串依次排列在同一个宽位向量中，构建共享的字符位掩码"""
+        mask = {}
+        start_bits = 0    # 各模式串首位
+        final_bits = 0    # 各模式串末位
+        final_owner = {}  # 末位 -> 模式串
+        offset = 0
+        for pattern in dict.fromkeys(p for p in patterns if p):
+            for i, c in enumerate(pattern):
+                mask[c] = mask.get(c, -1) & ~(1 << (offset + i))
+            start_bits |= 1 << offset
+            offset += len(pattern)
+            final_bits |= 1 << (offset - 1)
+            final_owner[offset - 1] = pattern
+            self.steps.append((pattern, offset - len(pattern), "打包模式串"))
+        return mask, start_bits, final_bits, final_owner
+    
+    def _collect_hits(self, hits: int, i: int, final_owner: Dict[int, str], result: Dict[str, List[int]]):
+        """把命中的末位翻译成模式串及其起始位置"""
+        while hits:
+            low = hits & -hits
+            pattern = final_owner[low.bit_length() - 1]
+            result.setdefault(pattern, []).append(i - len(pattern) + 1)
+            hits ^= low
+    
+    def multi_pattern_search(self, text: str, patterns: List[str]) -> Dict[str, List[int]]:
+        """多模式串匹配：所有模式串打包进一个宽位向量，一次扫描文本同时匹配"""
+        if not text:
+            return {}
+        
+        mask, start_bits, final_bits, final_owner = self._build_packed_masks(patterns)
+        result = {}
+        full = (1 << (max(final_owner, default=-1) + 1)) - 1
+        mask = {c: bits & full for c, bits in mask.items()}
+        state = full
+        for i, c in enumerate(text):
+            # 左移后把每个模式串首位清0，再与当前字符的掩码相或
+            state = (((state << 1) & ~start_bits) | mask.get(c, full)) & full
+            if ~state & final_bits:
+                self._collect_hits(~state & final_bits, i, final_owner, result)
+        
+        for pattern, positions in result.items():
+            self.steps.append((pattern, len(positions), "模式串匹配结果"))
+        return result
+    
+    def search_blocks(self, text: str, patterns: List[str]) -> Dict[str, List[int]]:
+        """长模式串的NumPy实现：沿文本方向逐列比较（见公共模块 vector_search），没有NumPy时退回multi_pattern_search"""
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        if vector_search.np is None:
+            return self.multi_pattern_search(text, patterns)
+        if not text:
+            return {}
+        
+        result = vector_search.column_search(text, patterns)
+        for pattern, positions in result.items():
+            self.steps.append((pattern, len(positions), "模式串匹配结果"))
+        return result
+    
+    def _build_byte_mask(self, pattern: bytes):
+        """构建256项字节位掩码，模式串不超过64字节时使用array('Q')"""
+        m = len(pattern)
+        full = (1 << m) - 1
+        mask = array('Q', [full]) * 256 if m <= 64 else [full] * 256
+        for i, b in enumerate(pattern):
+            mask[b] &= ~(1 << i)
+        return mask
+    
+    def search_bytes(self, data, pattern: bytes) -> List[int]:
+        """字节模式：直接在bytes/bytearray/memoryview/mmap上搜索（不解码，不记录操作步骤）"""
+        data = byte_view(data)
+        pattern = bytes(pattern)
+        m = len(pattern)
+        if not m or not len(data):
+            return []
+        
+        mask = self._build_byte_mask(pattern)
+        positions = []
+        full = (1 << m) - 1
+        state = full
+        match_bit = 1 << (m - 1)
+        
+        for i, c in enumerate(data):
+            state = ((state << 1) | mask[c]) & full
+            if not (state & match_bit):
+                positions.append(i - m + 1)
+        
+        return positions
 
 def print_operations(steps):
     """打印操作过程"""
@@ -139,13 +215,26 @@ def print_operations(steps):
             elif step[2] == "预处理字符位置":
                 char, pos, _ = step
                 print(f"预处理字符位置：字符 '{char}' 位置 {pos}")
+            elif step[2] == "打包模式串":
+                pattern, offset, _ = step
+                print(f"打包模式串：'{pattern}' 起始位 {offset}")
+            elif step[2] == "模式串匹配结果":
+                pattern, count, _ = step
+                print(f"模式串匹配结果：'{pattern}' 找到 {count} 处匹配")
             elif step[2] == "找到模糊匹配":
                 pos, errors, _ = step
-                print(f"找到模糊匹配：位置 {pos} 错误数 {errors}")
-        elif len(step) == 4:
-            pos, errors, bits, operation = step
-            if operation in ["模糊匹配状态", "错误状态更新"]:
-                print(f"{operation}：位置 {pos} 错误数 {errors} 状态 {bits}")
+                print(f"找到模糊匹配：结束位置 {pos} 错误数 {errors}")
+
+def get_input_patterns() -> List[str]:
+    """获取用户输入的模式串"""
+    patterns = []
+    print("请输入模式串（每行一个，输入空行结束）：")
+    while True:
+        pattern = input().strip()
+        if not pattern:
+            break
+        patterns.append(pattern)
+    return patterns
 
 if __name__ == '__main__':
     try:
@@ -162,9 +251,10 @@ if __name__ == '__main__':
             print("1. 精确匹配")
             print("2. 模糊匹配")
             print("3. 优化匹配")
-            print("4. 退出")
+            print("4. 多模式串匹配")
+            print("5. 退出")
             
-            choice = input("请输入选择（1-4）：")
+            choice = input("请输入选择（1-5）：")
             
             if choice == '1':
                 pattern = input("请输入要搜索的模式串：").strip()
@@ -190,7 +280,7 @@ if __name__ == '__main__':
                         if positions:
                             print("\n找到的模糊匹配：")
                             for pos, errors in positions:
-                                print(f"位置 {pos}（{errors}个错误）")
+                                print(f"结束位置 {pos}（{errors}个错误）")
                         else:
                             print("未找到匹配！")
                     except ValueError as e:
@@ -212,6 +302,21 @@ if __name__ == '__main__':
                     print("模式串不能为空！")
             
             elif choice == '4':
+                patterns = get_input_patterns()
+                if patterns:
+                    results = so.multi_pattern_search(text, patterns)
+                    if results:
+                        print("\n匹配结果：")
+                        for pattern, positions in results.items():
+                            print(f"\n模式串 '{pattern}' 的匹配位置：")
+                            for pos in positions:
+                                print(f"位置 {pos}")
+                    else:
+                        print("未找到任何匹配！")
+                else:
+                    print("至少需要输入一个模式串！")
+            
+            elif choice == '5':
                 break
             
             else:
@@ -7,17 +7,32 @@
 程序分析：
 1. 实现哈希函数
 2. 实现滚动哈希
-3. 支持多模式串匹配
+3. 支持多模式串匹配（双模64位哈希索引，NumPy向量化计算窗口哈希）
 4. 优化匹配过程
+5. 支持字节模式，直接扫描bytes/memoryview/mmap
+6. 基于滚动哈希的文档指纹（winnowing）与倒排索引，用于近似重复文档检测
 """
 
-from typing import List, Dict, Set
-from collections import defaultdict
+import os
+from itertools import combinations
+from typing import List, Dict, Set, Tuple, Iterable, Iterator, Optional
+from collections import defaultdict, deque, Counter
+
+from parallel_search import byte_view
+
+try:
+    import numpy as np
+except ImportError:  # 没有NumPy时窗口哈希逐个滚动计算
+    np = None
+
+# 多模式串匹配使用的双模哈希：两个31位质数，合成一个64位哈希键
+MOD1 = 2147483647
+MOD2 = 2147483629
 
 class RabinKarp:
-    def __init__(self, base: int = 256, prime: int = 101):
+    def __init__(self, base: int = 256, prime: int = (1 << 61) - 1):
         self.base = base      # 进制数（通常使用字符集大小）
-        self.prime = prime    # 用于取模的质数
+        self.prime = prime    # 用于取模的质数（默认2^61-1，窗口哈希几乎不会冲突）
         self.steps = []       # 记录操作步骤
     
     def _hash(self, s: str) -> int:
@@ -79,53 +94,228 @@ class RabinKarp:
         
         return positions
     
+    def _double_hash(self, s: str) -> int:
+        """计算字符串的双模哈希，合成为64位哈希键"""
+        h1 = h2 = 0
+        for c in s:
+            h1 = (h1 * self.base + ord(c)) % MOD1
+            h2 = (h2 * self.base + ord(c)) % MOD2
+        return (h1 << 32) | h2
+    
+    def _doubling_hashes(self, codes, length: int, mod: int):
+        """倍增计算所有长度为length的窗口哈希：H_2k(i) = H_k(i) * B^k + H_k(i+k)
+        
+        按length的二进制位拼接，只需O(log m)轮整体运算；模数小于2^31，乘积不会超出int64
+        """
+        n = len(codes)
+        block = codes % mod  # 当前长度为k的所有窗口哈希
+        k = 1
+        result = None        # 已拼接长度为r的所有窗口哈希
+        r = 0
+        while True:
+            if length & k:
+                if result is None:
+                    result = block
+                else:
+                    size = n - r - k + 1
+                    result = (result[:size] * pow(self.base, k, mod) + block[r:r + size]) % mod
+                r += k
+            if r == length:
+                return result
+            size = n - 2 * k + 1
+            block = (block[:size] * pow(self.base, k, mod) + block[k:k + size]) % mod
+            k *= 2
+    
+    def window_hashes(self, text: str, length: int):
+        """计算文本中所有长度为length的窗口的双模哈希键，有NumPy时整体向量化计算"""
+        count = len(text) - length + 1
+        if length <= 0 or count <= 0:
+            return []
+        
+        if np is not None:
+            codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32).astype(np.int64)
+            h1 = self._doubling_hashes(codes, length, MOD1)
+            h2 = self._doubling_hashes(codes, length, MOD2)
+            return (h1 << 32) | h2
+        
+        power1 = pow(self.base, length - 1, MOD1)
+        power2 = pow(self.base, length - 1, MOD2)
+        key = self._double_hash(text[:length])
+        h1, h2 = key >> 32, key & 0xFFFFFFFF
+        keys = [key]
+        for i in range(count - 1):
+            old, new = ord(text[i]), ord(text[i + length])
+            h1 = ((h1 - old * power1) * self.base + new) % MOD1
+            h2 = ((h2 - old * power2) * self.base + new) % MOD2
+            keys.append((h1 << 32) | h2)
+        return keys
+    
     def multi_pattern_search(self, text: str, patterns: List[str]) -> Dict[str, List[int]]:
-        """多模式串匹配"""
+        """多模式串匹配：同长度的模式串建立 哈希键->模式串 的索引，每个窗口只需一次查找"""
         result = {}
         # 按长度分组模式串
         patterns_by_length = defaultdict(list)
-        for pattern in patterns:
-            patterns_by_length[len(pattern)].append(pattern)
+        for pattern in dict.fromkeys(patterns):
+            if pattern:
+                patterns_by_length[len(pattern)].append(pattern)
         
         # 对每组长度的模式串进行匹配
         for length, group in patterns_by_length.items():
-            # 计算所有模式串的哈希值
-            pattern_hashes = {pattern: self._hash(pattern) for pattern in group}
             self.steps.append((length, len(group), "分组处理"))
-            
-            # 在文本中搜索
-            n = len(text)
-            if length > n:
+            if length > len(text):
                 continue
             
-            # 计算用于移除最高位的幂
-            power = pow(self.base, length-1) % self.prime
-            
-            # 计算第一个窗口的哈希值
-            text_hash = self._hash(text[:length])
-            
-            # 检查第一个窗口
-            window = text[:length]
+            index = defaultdict(list)
             for pattern in group:
-                if text_hash == pattern_hashes[pattern] and window == pattern:
-                    if pattern not in result:
-                        result[pattern] = []
-                    result[pattern].append(0)
-                    self.steps.append((pattern, 0, "找到多模式匹配"))
+                index[self._double_hash(pattern)].append(pattern)
+            
+            keys = self.window_hashes(text, length)
+            if np is not None:
+                table = np.fromiter(index, dtype=np.int64, count=len(index))
+                candidates = np.flatnonzero(np.isin(keys, table)).tolist()
+            else:
+                candidates = [i for i, key in enumerate(keys) if key in index]
             
-            # 滑动窗口
-            for i in range(n - length):
-                text_hash = self._rolling_hash(text_hash, text[i], text[i+length], power)
-                window = text[i+1:i+length+1]
-                
-                for pattern in group:
-                    if text_hash == pattern_hashes[pattern] and window == pattern:
-                        if pattern not in result:
-                            result[pattern] = []
-                        result[pattern].append(i + 1)
-                        self.steps.append((pattern, i + 1, "找到多模式匹配"))
+            # 哈希命中后再比较字符串，排除极少数冲突
+            for i in candidates:
+                window = text[i:i + length]
+                for pattern in index[int(keys[i])]:
+                    if window == pattern:
+                        result.setdefault(pattern, []).append(i)
+                        self.steps.append((pattern, i, "找到多模式匹配"))
         
         return result
+    
+    def search_bytes(self, data, pattern: bytes) -> List[int]:
+        """字节模式：直接在bytes/bytearray/memoryview/mmap上搜索（不解码，不记录操作步骤）"""
+        data = byte_view(data)
+        pattern = bytes(pattern)
+        n, m = len(data), len(pattern)
+        if not m or m > n:
+            return []
+        
+        base, prime = self.base, self.prime
+        power = pow(base, m - 1, prime)
+        pattern_hash = 0
+        text_hash = 0
+        for i in range(m):
+            pattern_hash = (pattern_hash * base + pattern[i]) % prime
+            text_hash = (text_hash * base + data[i]) % prime
+        
+        positions = []
+        for i in range(n - m + 1):
+            if text_hash == pattern_hash and data[i:i+m] == pattern:
+                positions.append(i)
+            if i + m < n:
+                text_hash = ((text_hash - data[i] * power) * base + data[i+m]) % prime
+        
+        return positions
+
+def winnow(hashes: Iterable[int], window: int) -> Iterator[Tuple[int, int]]:
+    """winnowing：在每w个连续的k-gram哈希中选最小值（并列取最右），产出(指纹, 偏移)
+    
+    用单调队列维护窗口最小值，整体线性时间；hashes可以是流式的生成器
+    """
+    if window <= 0:
+        raise ValueError("窗口大小必须为正数！")
+    candidates = deque()  # (哈希值, 偏移)，哈希值单调递增
+    last = -1             # 上一次选中的偏移
+    for i, h in enumerate(hashes):
+        while candidates and candidates[-1][0] >= h:
+            candidates.pop()
+        candidates.append((h, i))
+        if candidates[0][1] <= i - window:
+            candidates.popleft()
+        if i >= window - 1 and candidates[0][1] != last:
+            last = candidates[0][1]
+            yield candidates[0]
+
+class FingerprintIndex:
+    """文档指纹倒排索引：指纹 -> [(文档, 偏移)]，用于在大量文档中查找近似重复"""
+    def __init__(self, k: int = 5, window: int = 4, rk: Optional[RabinKarp] = None):
+        if k <= 0:
+            raise ValueError("k-gram长度必须为正数！")
+        self.k = k              # k-gram长度
+        self.window = window    # winnowing窗口大小
+        self.rk = rk or RabinKarp()
+        self.index = defaultdict(list)
+        self.doc_hashes = defaultdict(set)  # 文档 -> 不同指纹的集合
+    
+    def _stream_hashes(self, chunks: Iterable[str]) -> Iterator[int]:
+        """对分块到达的文本计算k-gram哈希，块之间保留k-1个字符衔接"""
+        tail = ''
+        for chunk in chunks:
+            buf = tail + chunk
+            for key in self.rk.window_hashes(buf, self.k):
+                yield int(key)
+            tail = buf[-(self.k - 1):] if self.k > 1 else ''
+    
+    def _add(self, doc_id, chunks: Iterable[str]) -> int:
+        """把文档的指纹加入索引，返回指纹数量（按出现次数计）"""
+        count = 0
+        hashes = self.doc_hashes[doc_id]
+        for h, offset in winnow(self._stream_hashes(chunks), self.window):
+            self.index[h].append((doc_id, offset))
+            hashes.add(h)
+            count += 1
+        return count
+    
+    def add_document(self, doc_id, text: str) -> int:
+        """添加一篇文档"""
+        return self._add(doc_id, [text])
+    
+    def add_file(self, path: str, doc_id=None, encoding: str = 'utf-8', chunk_size: int = 1 << 20) -> int:
+        """流式读取文件并添加，内存占用与文件大小无关"""
+        def chunks():
+            with open(path, encoding=encoding, errors='replace') as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        return self._add(path if doc_id is None else doc_id, chunks())
+    
+    def add_directory(self, directory: str, suffix: str = '.csv', encoding: str = 'utf-8') -> int:
+        """添加目录下所有指定后缀的文件，返回文件数量"""
+        names = sorted(name for name in os.listdir(directory) if name.endswith(suffix))
+        for name in names:
+            self.add_file(os.path.join(directory, name), encoding=encoding)
+        return len(names)
+    
+    def fingerprint(self, text: str) -> List[Tuple[int, int]]:
+        """计算一段文本的指纹"""
+        return list(winnow(self._stream_hashes([text]), self.window))
+    
+    def query(self, text: str) -> Dict[object, int]:
+        """查找与文本共享指纹的文档，返回 文档 -> 共享指纹数"""
+        shared = Counter()
+        for h in {h for h, _ in self.fingerprint(text)}:
+            shared.update({doc_id for doc_id, _ in self.index.get(h, [])})
+        return dict(shared.most_common())
+    
+    def similar_pairs(self, threshold: float = 0.5, max_df: int = 100) -> List[Tuple[object, object, float]]:
+        """找出近似重复的文档对，相似度 = 共享的不同指纹数 / 较小文档的不同指纹数
+        
+        分子分母都按不同的指纹计数，内容相同的文档相似度为1；
+        出现在超过max_df篇文档中的指纹（如公共表头）不参与比较，也不计入分母
+        """
+        shared = Counter()
+        sizes = {doc_id: len(hashes) for doc_id, hashes in self.doc_hashes.items()}
+        for postings in self.index.values():
+            docs = sorted({doc_id for doc_id, _ in postings}, key=str)
+            if len(docs) > max_df:
+                for doc_id in docs:
+                    sizes[doc_id] -= 1
+            elif len(docs) > 1:
+                shared.update(combinations(docs, 2))
+        
+        pairs = []
+        for (a, b), count in shared.items():
+            similarity = count / max(1, min(sizes[a], sizes[b]))
+            if similarity >= threshold:
+                pairs.append((a, b, similarity))
+        pairs.sort(key=lambda item: -item[2])
+        return pairs
 
 def print_operations(steps):
     """打印操作过程"""
@@ -179,9 +369,10 @@ if __name__ == '__main__':
             print("\n请选择操作：")
             print("1. 单模式串匹配")
             print("2. 多模式串匹配")
-            print("3. 退出")
+            print("3. 近似重复文档检测")
+            print("4. 退出")
             
-            choice = input("请输入选择（1-3）：")
+            choice = input("请输入选择（1-4）：")
             
             if choice == '1':
                 pattern = input("请输入要搜索的模式串：").strip()
@@ -212,6 +403,19 @@ if __name__ == '__main__':
                     print("至少需要输入一个模式串！")
             
             elif choice == '3':
+                default_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'us_report')
+                directory = input(f"请输入文档目录（直接回车使用 {default_dir}）：").strip() or default_dir
+                if os.path.isdir(directory):
+                    fp_index = FingerprintIndex(k=20, window=10, rk=rk)
+                    count = fp_index.add_directory(directory)
+                    pairs = fp_index.similar_pairs(threshold=0.8)
+                    print(f"\n共索引 {count} 个文件，找到 {len(pairs)} 对近似重复文档")
+                    for a, b, similarity in pairs[:10]:
+                        print(f"{os.path.basename(a)} 与 {os.path.basename(b)}：相似度 {similarity:.2f}")
+                else:
+                    print("目录不存在！")
+            
+            elif choice == '4':
                 break
             
             else:
@@ -9,8 +9,12 @@
 2. 实现哈希函数
 3. 实现模式串匹配
 4. 优化匹配过程
+5. 支持预编译模式串集合（PatternSet），移动表与哈希表存放在扁平数组中，可重复使用并保存到磁盘
 """
 
+import json
+import sys
+from array import array
 from typing import List, Dict, Set, Tuple
 from collections import defaultdict
 
@@ -121,6 +125,153 @@ class WuManber:
         
         return result
 
+class PatternSet:
+    """预编译的Wu-Manber模式串集合：移动表和哈希表只构建一次，可在多个文本上重复使用并保存到磁盘
+    
+    块哈希是 2^HASH_BITS 取模的多项式哈希，相邻位置之间可以滚动更新；
+    移动表、哈希桶、前缀哈希都存放在扁平的array中
+    """
+    HASH_BITS = 16
+    BASE = 257
+    
+    def __init__(self, patterns: List[str], block_size: int = 2):
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        if not self.patterns:
+            raise ValueError("模式串不能为空！")
+        self.min_len = min(len(p) for p in self.patterns)
+        self.block_size = max(1, min(block_size, self.min_len))
+        m, b = self.min_len, self.block_size
+        size = 1 << self.HASH_BITS
+        
+        # 移动表：以块哈希为下标，默认可以移动 m - b + 1
+        self.shift = array('i', [m - b + 1]) * size
+        for pattern in self.patterns:
+            for q in range(b - 1, m):
+                h = self._block_hash(pattern, q)
+                self.shift[h] = min(self.shift[h], m - 1 - q)
+        
+        # 哈希表（CSR格式）：bucket_start[h]:bucket_start[h+1] 是末块哈希为h的模式串编号
+        tails = [self._block_hash(p, m - 1) for p in self.patterns]
+        counts = array('i', [0]) * (size + 1)
+        for h in tails:
+            counts[h + 1] += 1
+        for h in range(size):
+            counts[h + 1] += counts[h]
+        self.bucket_start = array('i', counts)
+        self.bucket_items = array('i', [0]) * len(self.patterns)
+        for idx, h in enumerate(tails):
+            self.bucket_items[counts[h]] = idx
+            counts[h] += 1
+        
+        # 前缀哈希：用于在逐个比较模式串之前快速过滤
+        self.prefix_hash = array('i', [self._block_hash(p, b - 1) for p in self.patterns])
+    
+    def _block_hash(self, s: str, end: int) -> int:
+        """计算以end结尾、长度为block_size的块的哈希值"""
+        h = 0
+        for c in s[end - self.block_size + 1:end + 1]:
+            h = h * self.BASE + ord(c)
+        return h & ((1 << self.HASH_BITS) - 1)
+    
+    def search(self, text: str) -> Dict[str, List[int]]:
+        """在文本中搜索所有模式串"""
+        result = defaultdict(list)
+        n, m, b = len(text), self.min_len, self.block_size
+        mask = (1 << self.HASH_BITS) - 1
+        top = pow(self.BASE, b - 1, 1 << self.HASH_BITS)
+        shift, bucket_start, bucket_items = self.shift, self.bucket_start, self.bucket_items
+        patterns, prefix_hash = self.patterns, self.prefix_hash
+        
+        pos = m - 1
+        h, h_end = 0, -b  # h为以h_end结尾的块的哈希值
+        while pos < n:
+            if pos - h_end < b:
+                # 与上一个块重叠，滚动更新哈希
+                while h_end < pos:
+                    h_end += 1
+                    h = ((h - ord(text[h_end - b]) * top) * self.BASE + ord(text[h_end])) & mask
+            else:
+                h, h_end = self._block_hash(text, pos), pos
+            
+            s = shift[h]
+            if s:
+                pos += s
+                continue
+            
+            # 移动距离为0，检查末块哈希为h的候选模式串
+            start = pos - m + 1
+            head = self._block_hash(text, start + b - 1)
+            for k in range(bucket_start[h], bucket_start[h + 1]):
+                idx = bucket_items[k]
+                if prefix_hash[idx] == head and text.startswith(patterns[idx], start):
+                    result[patterns[idx]].append(start)
+            pos += 1
+        
+        return dict(result)
+    
+    FORMAT = 'wu-manber-pattern-set'
+    VERSION = 1
+    TABLES = ('shift', 'bucket_start', 'bucket_items', 'prefix_hash')
+    
+    def save(self, path: str) -> None:
+        """保存到磁盘：第一行是JSON文件头（模式串、参数、各数组长度），随后依次写入各数组的原始字节"""
+        header = {
+            'format': self.FORMAT, 'version': self.VERSION, 'byteorder': sys.byteorder,
+            'itemsize': self.shift.itemsize, 'hash_bits': self.HASH_BITS, 'base': self.BASE,
+            'block_size': self.block_size, 'patterns': self.patterns,
+            'lengths': [len(getattr(self, name)) for name in self.TABLES],
+        }
+        with open(path, 'wb') as f:
+            f.write(json.dumps(header).encode('ascii') + b'\n')
+            for name in self.TABLES:
+                getattr(self, name).tofile(f)
+    
+    @classmethod
+    def load(cls, path: str) -> 'PatternSet':
+        """从磁盘加载：校验文件头后直接读回数组，不重新构建，也不执行文件中的任何代码"""
+        with open(path, 'rb') as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                raise ValueError("文件内容不是模式串集合！")
+            if not isinstance(header, dict) or header.get('format') != cls.FORMAT:
+                raise ValueError("文件内容不是模式串集合！")
+            if header.get('version') != cls.VERSION:
+                raise ValueError(f"不支持的文件版本：{header.get('version')}")
+            if (header.get('byteorder') != sys.byteorder or header.get('itemsize') != array('i').itemsize
+                    or header.get('hash_bits') != cls.HASH_BITS or header.get('base') != cls.BASE):
+                raise ValueError("文件与本机的字节序或哈希参数不一致！")
+            
+            patterns = header.get('patterns')
+            lengths = header.get('lengths')
+            block_size = header.get('block_size')
+            if (not isinstance(patterns, list) or not patterns
+                    or not all(isinstance(p, str) and p for p in patterns)
+                    or not isinstance(block_size, int) or not 1 <= block_size <= min(map(len, patterns))
+                    or lengths != [1 << cls.HASH_BITS, (1 << cls.HASH_BITS) + 1, len(patterns), len(patterns)]):
+                raise ValueError("文件内容不是模式串集合！")
+            
+            pattern_set = cls.__new__(cls)
+            pattern_set.patterns = patterns
+            pattern_set.min_len = min(len(p) for p in patterns)
+            pattern_set.block_size = block_size
+            for name, length in zip(cls.TABLES, lengths):
+                table = array('i')
+                try:
+                    table.fromfile(f, length)
+                except (EOFError, ValueError):
+                    raise ValueError("文件不完整！")
+                setattr(pattern_set, name, table)
+        
+        # 表中的值会被用作下标和移动距离，越界或为负时拒绝加载
+        count = len(patterns)
+        if (min(pattern_set.shift) < 0 or pattern_set.bucket_start[0] != 0
+                or pattern_set.bucket_start[-1] != count
+                or any(a > b for a, b in zip(pattern_set.bucket_start, pattern_set.bucket_start[1:]))
+                or not all(0 <= idx < count for idx in pattern_set.bucket_items)):
+            raise ValueError("文件内容不是模式串集合！")
+        return pattern_set
+
 def print_operations(steps):
     """打印操作过程"""
     print("\n操作过程：")
@@ -9,8 +9,12 @@
 2. 实现移动函数
 3. 实现模式串匹配
 4. 优化匹配过程
+5. 支持预编译模式串集合（PatternSet），反向Trie与移动表只构建一次，可重复使用并保存到磁盘
 """
 
+import json
+import sys
+from array import array
 from typing import List, Dict, Set, Optional
 from collections import defaultdict
 
@@ -123,6 +127,130 @@ class CommentzWalter:
         
         return dict(result)
 
+class PatternSet:
+    """预编译的Commentz-Walter模式串集合：反向Trie和移动表只构建一次，可在多个文本上重复使用并保存到磁盘
+    
+    反向Trie存放在扁平结构中：转移表以 节点编号 * 0x110000 + 字符编码 为键，
+    terminal[节点] 为以该节点结束的模式串编号（没有则为-1）
+    """
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        if not self.patterns:
+            raise ValueError("模式串不能为空！")
+        self.min_len = min(len(p) for p in self.patterns)
+        
+        # 反向Trie：从模式串末尾向前插入
+        self.goto = {}
+        terminal = [-1]
+        for idx, pattern in enumerate(self.patterns):
+            node = 0
+            for c in reversed(pattern):
+                key = node * 0x110000 + ord(c)
+                if key not in self.goto:
+                    self.goto[key] = len(terminal)
+                    terminal.append(-1)
+                node = self.goto[key]
+            terminal[node] = idx
+        self.terminal = array('i', terminal)
+        
+        # 移动表：字符在各模式串末尾min_len个字符中（不含最后一个）最靠右出现处到末尾的距离
+        self.shift = {}
+        for pattern in self.patterns:
+            n = len(pattern)
+            for j in range(1, self.min_len):
+                c = pattern[n - 1 - j]
+                if j < self.shift.get(c, self.min_len):
+                    self.shift[c] = j
+    
+    def search(self, text: str) -> Dict[str, List[int]]:
+        """在文本中搜索所有模式串"""
+        result = defaultdict(list)
+        goto, terminal, patterns = self.goto, self.terminal, self.patterns
+        shift, m = self.shift, self.min_len
+        
+        pos = m - 1
+        while pos < len(text):
+            # 从窗口末尾开始沿反向Trie向前匹配
+            node, k = 0, pos
+            while k >= 0:
+                node = goto.get(node * 0x110000 + ord(text[k]))
+                if node is None:
+                    break
+                if terminal[node] >= 0:
+                    result[patterns[terminal[node]]].append(k)
+                k -= 1
+            pos += shift.get(text[pos], m)
+        
+        return {pattern: sorted(positions) for pattern, positions in result.items()}
+    
+    FORMAT = 'commentz-walter-pattern-set'
+    VERSION = 1
+    
+    def save(self, path: str) -> None:
+        """保存到磁盘：第一行是JSON文件头（模式串、移动表、各数组长度），
+        随后依次写入转移表的键、转移表的目标节点和terminal数组的原始字节
+        """
+        keys = array('q', self.goto.keys())
+        nodes = array('i', self.goto.values())
+        header = {
+            'format': self.FORMAT, 'version': self.VERSION, 'byteorder': sys.byteorder,
+            'itemsize': [keys.itemsize, nodes.itemsize], 'patterns': self.patterns,
+            'shift': self.shift, 'lengths': [len(keys), len(self.terminal)],
+        }
+        with open(path, 'wb') as f:
+            f.write(json.dumps(header).encode('ascii') + b'\n')
+            keys.tofile(f)
+            nodes.tofile(f)
+            self.terminal.tofile(f)
+    
+    @classmethod
+    def load(cls, path: str) -> 'PatternSet':
+        """从磁盘加载：校验文件头后直接读回各表，不重新构建，也不执行文件中的任何代码"""
+        with open(path, 'rb') as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                raise ValueError("文件内容不是模式串集合！")
+            if not isinstance(header, dict) or header.get('format') != cls.FORMAT:
+                raise ValueError("文件内容不是模式串集合！")
+            if header.get('version') != cls.VERSION:
+                raise ValueError(f"不支持的文件版本：{header.get('version')}")
+            if (header.get('byteorder') != sys.byteorder
+                    or header.get('itemsize') != [array('q').itemsize, array('i').itemsize]):
+                raise ValueError("文件与本机的字节序不一致！")
+            
+            patterns = header.get('patterns')
+            shift = header.get('shift')
+            lengths = header.get('lengths')
+            if (not isinstance(patterns, list) or not patterns
+                    or not all(isinstance(p, str) and p for p in patterns)
+                    or not isinstance(shift, dict) or not all(isinstance(v, int) and v > 0 for v in shift.values())
+                    or not isinstance(lengths, list) or len(lengths) != 2
+                    or not all(isinstance(n, int) and n >= 0 for n in lengths)):
+                raise ValueError("文件内容不是模式串集合！")
+            
+            keys, nodes, terminal = array('q'), array('i'), array('i')
+            try:
+                keys.fromfile(f, lengths[0])
+                nodes.fromfile(f, lengths[0])
+                terminal.fromfile(f, lengths[1])
+            except (EOFError, ValueError):
+                raise ValueError("文件不完整！")
+        
+        # 表中的值会被用作下标，越界时拒绝加载
+        count = len(patterns)
+        if (not terminal or not all(0 < node < len(terminal) for node in nodes)
+                or not all(-1 <= idx < count for idx in terminal)):
+            raise ValueError("文件内容不是模式串集合！")
+        
+        pattern_set = cls.__new__(cls)
+        pattern_set.patterns = patterns
+        pattern_set.min_len = min(len(p) for p in patterns)
+        pattern_set.goto = dict(zip(keys, nodes))
+        pattern_set.terminal = terminal
+        pattern_set.shift = shift
+        return pattern_set
+
 def print_operations(steps):
     """打印操作过程"""
     print("\n操作过程：")
@@ -0,0 +1,231 @@
+#!/usr/bin/python
+# -*- coding: UTF-8 -*-
+
+"""
+题目：将构建好的字典树冻结为只读的二进制快照（供 045、056、072 的字典树共用）。
+
+程序分析：
+1. 按广度优先顺序给节点编号，每个节点的子节点编号连续，按字符排好序
+2. 只用三个连续数组表示整棵树：子节点起点 first（n+1 项）、入边字符 label、单词结尾标记 terminal
+3. 快照写入文件后用 mmap 映射回来，数组直接以 memoryview 视图访问，加载时间与词典大小无关
+4. 查找时在子节点区间内二分字符，不需要把节点还原成对象
+5. 文件头记录魔数、版本、字节序标记和节点数，加载时校验
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Iterator, List, Optional, Tuple
+
+MAGIC = b'FTRI'
+VERSION = 1
+BYTE_ORDER_MARK = 0x01020304  # 按本机字节序写入，读回不相等说明字节序不同
+HEADER = struct.Struct('=4sIIII')  # 魔数、版本、字节序标记、节点数、单词数
+
+def _children(trie, node) -> List[Tuple[str, object]]:
+    """按字符排序列出子节点，兼容节点对象字典树和数组字典树"""
+    if hasattr(trie, 'root'):
+        return sorted(node.children.items())
+    return [(chr(ord('a') + i), child) for i, child in enumerate(trie.nodes[node]) if child]
+
+def _is_end(trie, node) -> bool:
+    if hasattr(trie, 'root'):
+        return node.is_end
+    return trie.is_end[node]
+
+def freeze(trie) -> bytes:
+    """把字典树（045/072 的 Trie，或 056 的 TrieArray）序列化为快照字节串"""
+    root = trie.root if hasattr(trie, 'root') else 0
+    first = array('I', [1])
+    label = array('I', [0])
+    terminal = bytearray([_is_end(trie, root)])
+
+    # 广度优先编号：出队顺序即节点编号，子节点依次追加在末尾
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        for char, child in _children(trie, node):
+            label.append(ord(char))
+            terminal.append(_is_end(trie, child))
+            queue.append(child)
+        first.append(len(label))
+
+    n = len(label)
+    terminal += bytes(-n % 4)  # 补齐到4字节
+    header = HEADER.pack(MAGIC, VERSION, BYTE_ORDER_MARK, n, sum(terminal))
+    return header + first.tobytes() + label.tobytes() + bytes(terminal)
+
+def save(trie, path: str) -> None:
+    """冻结字典树并写入文件"""
+    with open(path, 'wb') as f:
+        f.write(freeze(trie))
+
+class FrozenTrie:
+    """只读字典树：所有查找直接在快照缓冲区上进行"""
+    def __init__(self, buffer, mm: Optional[mmap.mmap] = None):
+        # 先校验文件头和长度再创建视图，校验失败时不会留下未释放的导出缓冲区
+        if len(buffer) < HEADER.size:
+            raise ValueError("快照文件不完整！")
+        magic, version, mark, n, words = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("不是字典树快照文件！")
+        if version != VERSION:
+            raise ValueError(f"不支持的快照版本：{version}")
+        if mark != BYTE_ORDER_MARK:
+            raise ValueError("快照的字节序与本机不一致！")
+
+        offset = HEADER.size
+        size = 4 * (n + 1) + 4 * n + n + (-n % 4)
+        if len(buffer) < offset + size:
+            raise ValueError("快照文件不完整！")
+        view = memoryview(buffer)
+        self.first = view[offset:offset + 4 * (n + 1)].cast('I')
+        offset += 4 * (n + 1)
+        self.label = view[offset:offset + 4 * n].cast('I')
+        offset += 4 * n
+        self.terminal = view[offset:offset + n]
+        self.size = n          # 节点数量
+        self.word_count = words  # 单词数量
+        self._view = view
+        self._mm = mm
+
+    @classmethod
+    def load(cls, path: str) -> 'FrozenTrie':
+        """以只读方式映射快照文件，不解析、不复制"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("快照文件不完整！")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mm, mm)
+        except ValueError:
+            mm.close()
+            raise
+
+    @classmethod
+    def from_trie(cls, trie) -> 'FrozenTrie':
+        """直接在内存中冻结字典树"""
+        return cls(freeze(trie))
+
+    def close(self) -> None:
+        """释放缓冲区视图并关闭映射"""
+        for view in (self.first, self.label, self.terminal, self._view):
+            view.release()
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self) -> 'FrozenTrie':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _child(self, node: int, char: str) -> int:
+        """在子节点区间内二分查找字符，不存在时返回-1"""
+        lo, hi = self.first[node], self.first[node + 1]
+        code = ord(char)
+        i = bisect_left(self.label, code, lo, hi)
+        if i < hi and self.label[i] == code:
+            return i
+        return -1
+
+    def _find_node(self, prefix: str) -> int:
+        node = 0
+        for char in prefix:
+            node = self._child(node, char)
+            if node < 0:
+                return -1
+        return node
+
+    def search(self, word: str) -> bool:
+        """查找单词"""
+        node = self._find_node(word)
+        return node >= 0 and bool(self.terminal[node])
+
+    def starts_with(self, prefix: str) -> bool:
+        """查找前缀"""
+        return self._find_node(prefix) >= 0
+
+    def iter_words_with_prefix(self, prefix: str = "") -> Iterator[str]:
+        """按字典序逐个产出指定前缀的单词"""
+        node = self._find_node(prefix)
+        if node < 0:
+            return
+        first, label, terminal = self.first, self.label, self.terminal
+        stack = [(node, prefix)]
+        while stack:
+            node, current = stack.pop()
+            if terminal[node]:
+                yield current
+            for child in range(first[node + 1] - 1, first[node] - 1, -1):
+                stack.append((child, current + chr(label[child])))
+
+    def __contains__(self, word: str) -> bool:
+        return self.search(word)
+
+    def __len__(self) -> int:
+        return self.word_count
+
+if __name__ == '__main__':
+    try:
+        path = input("请输入快照文件路径：").strip()
+        if not path:
+            raise ValueError("路径不能为空！")
+
+        if not os.path.isfile(path):
+            # 快照不存在时，从词表文件构建（每行一个单词）
+            source = input("快照不存在，请输入词表文件路径：").strip()
+            if not os.path.isfile(source):
+                raise ValueError("词表文件不存在！")
+            import importlib
+            Trie = importlib.import_module('072_trie_tree').Trie
+            trie = Trie()
+            with open(source, encoding='utf-8') as f:
+                for line in f:
+                    word = line.strip()
+                    if word:
+                        trie.insert(word)
+            save(trie, path)
+            print(f"已写入快照：{path}")
+
+        with FrozenTrie.load(path) as frozen:
+            print(f"\n已加载快照：{frozen.size} 个节点，{len(frozen)} 个单词")
+            while True:
+                print("\n请选择操作：")
+                print("1. 查找单词")
+                print("2. 查找前缀")
+                print("3. 列出前缀匹配的单词")
+                print("4. 退出")
+
+                choice = input("请输入选择（1-4）：")
+
+                if choice == '1':
+                    word = input("请输入要查找的单词：").strip()
+                    print("找到单词！" if frozen.search(word) else "未找到单词！")
+
+                elif choice == '2':
+                    prefix = input("请输入要查找的前缀：").strip()
+                    print("找到前缀！" if frozen.starts_with(prefix) else "未找到前缀！")
+
+                elif choice == '3':
+                    prefix = input("请输入前缀：").strip()
+                    words = list(frozen.iter_words_with_prefix(prefix))
+                    if words:
+                        print(f"\n以'{prefix}'为前缀的单词：")
+                        for word in words:
+                            print(word)
+                    else:
+                        print("没有找到匹配的单词！")
+
+                elif choice == '4':
+                    break
+
+                else:
+                    print("无效的选择！")
+
+    except ValueError as e:
+        print(f"错误：{str(e)}")
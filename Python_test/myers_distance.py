@@ -0,0 +1,93 @@
+#!/usr/bin/python
+# -*- coding: UTF-8 -*-
+
+"""
+题目：Myers位并行编辑距离（供 082、083 的模糊匹配共用）。
+
+程序分析：
+1. 模式串的每个字符对应一个位向量peq[c]，第i位为1表示pattern[i]等于c
+2. 用垂直差值位向量pv/mv表示动态规划表的一整列，每读入一个文本字符只做常数次大整数位运算
+3. 近似搜索时第0行恒为0（模式串可从任意位置开始），全局编辑距离时第0行逐列加1
+4. 耗时与允许的错误数k无关；计算两个词的距离时，确定超过k即可提前结束
+5. 批量查词时词典按长度分组，长度差超过k的词直接跳过，每个单词的peq只构建一次
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterator, List, Tuple
+
+def build_peq(pattern: str) -> Dict[str, int]:
+    """构建字符匹配位向量：第i位为1表示pattern[i]等于该字符"""
+    peq = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+def myers_scan(peq: Dict[str, int], m: int, text: str, search: bool) -> Iterator[Tuple[int, int]]:
+    """Myers/Hyyrö位并行编辑距离，逐个产出(文本位置, 以该位置结尾时模式串的编辑距离)
+
+    search为True时模式串可以从文本任意位置开始（近似搜索），否则与整个文本比较（全局编辑距离）
+    """
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for j, c in enumerate(text):
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # 第0行的水平差值：搜索模式下恒为0，全局模式下为+1
+        ph = ((ph << 1) | (0 if search else 1)) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+        yield j, score
+
+def bounded_distance(peq: Dict[str, int], m: int, word: str, k: int) -> int:
+    """计算模式串与word的编辑距离，确定超过k时提前结束并返回k+1"""
+    n = len(word)
+    if not m or not n:
+        return max(m, n)
+
+    score = m
+    for j, score in myers_scan(peq, m, word, False):
+        # 剩余的字符最多让距离再减少 n - j - 1
+        if score - (n - j - 1) > k:
+            return k + 1
+    return score
+
+def fuzzy_search(text: str, pattern: str, k: int) -> List[Tuple[int, int]]:
+    """支持k个错误的模糊匹配，返回(结束位置, 编辑距离)列表"""
+    if not pattern or not text or k < 0:
+        return []
+    peq = build_peq(pattern)
+    return [(j, score) for j, score in myers_scan(peq, len(pattern), text, True) if score <= k]
+
+def fuzzy_lookup(words: List[str], dictionary: List[str], k: int) -> Dict[str, List[Tuple[str, int]]]:
+    """批量模糊查词：为每个单词找出词典中编辑距离不超过k的词，按距离排序"""
+    if k < 0:
+        return {}
+
+    # 词典按长度分组，长度差超过k的词不可能满足条件
+    by_length = defaultdict(list)
+    for entry in dict.fromkeys(dictionary):
+        by_length[len(entry)].append(entry)
+
+    result = {}
+    for word in dict.fromkeys(words):
+        m = len(word)
+        peq = build_peq(word)  # 每个单词只构建一次，与所有候选词比较时复用
+        matches = []
+        for length in range(max(0, m - k), m + k + 1):
+            for entry in by_length.get(length, []):
+                distance = bounded_distance(peq, m, entry, k)
+                if distance <= k:
+                    matches.append((entry, distance))
+        matches.sort(key=lambda item: (item[1], item[0]))
+        result[word] = matches
+
+    return result
@@ -0,0 +1,333 @@
+#!/usr/bin/python
+# -*- coding: UTF-8 -*-
+
+"""
+题目：数论公共模块：分段筛、最小质因子表、Miller-Rabin素性检验与Pollard-rho分解（供 011、012、014、019 等共用）。
+
+程序分析：
+1. 分段埃氏筛：只筛奇数，每段用固定大小的bytearray，整段切片赋值划掉倍数，内存与区间长度无关
+2. 用itertools.compress在C层取出素数，区间可达10^10
+3. 最小质因子表：按质数从大到小切片赋值，小质数最后覆盖，批量分解时每个数只需O(log n)次查表
+4. Miller-Rabin：取前13个质数为底，对3.3*10^24以内的整数是确定性的
+5. Pollard-rho（Brent改进）分解大整数，小因子先用试除去掉
+6. 因子和筛：按块计算区间内每个数的真因子之和，块内只枚举不超过sqrt的因子d，
+   同时累加d和配对的因子，可用NumPy向量化
+7. 完数：由欧几里得-欧拉定理直接由梅森素数生成，梅森数用Lucas-Lehmer检验
+"""
+
+import math
+import random
+from array import array
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # 没有NumPy时因子和筛退化为纯Python循环
+    np = None
+
+SEGMENT_SIZE = 1 << 18  # 每段包含的奇数个数（256KB）
+SIGMA_CHUNK_SIZE = 1 << 20  # 因子和筛每块包含的整数个数
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)  # Miller-Rabin的底
+
+def simple_sieve(limit: int) -> List[int]:
+    """普通埃氏筛，返回不超过limit的所有素数"""
+    if limit < 2:
+        return []
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return list(compress(range(limit + 1), sieve))
+
+def _segments(start: int, end: int, segment_size: int) -> Iterator[Tuple[int, int, bytearray]]:
+    """逐段筛[start, end]内的奇数，产出(段起点, 段终点, 筛表)，筛表第i项对应奇数 段起点+2i"""
+    base = simple_sieve(math.isqrt(end))[1:]  # 只需要奇素数
+    low = max(start, 3) | 1  # 第一个奇数
+    while low <= end:
+        high = min(low + 2 * segment_size, end + 1)  # 本段为[low, high)内的奇数
+        size = (high - low + 1) // 2
+        segment = bytearray([1]) * size
+        for p in base:
+            if p * p >= high:
+                break
+            # 本段内p的第一个奇数倍，且不小于p*p
+            first = max(p * p, (low + p - 1) // p * p)
+            if first % 2 == 0:
+                first += p
+            index = (first - low) // 2
+            if index < size:
+                segment[index::p] = bytes(len(range(index, size, p)))
+        yield low, high, segment
+        low = high if high % 2 else high + 1
+
+def iter_primes(start: int, end: int, segment_size: int = SEGMENT_SIZE) -> Iterator[int]:
+    """按从小到大的顺序产出[start, end]内的素数，每次只保留一段筛表"""
+    if end < 2 or start > end:
+        return
+    if start <= 2:
+        yield 2
+    for low, high, segment in _segments(start, end, segment_size):
+        yield from compress(range(low, high, 2), segment)
+
+def find_primes(start: int, end: int) -> List[int]:
+    """找出[start, end]内的所有素数"""
+    return list(iter_primes(start, end))
+
+def count_primes(start: int, end: int, segment_size: int = SEGMENT_SIZE) -> int:
+    """统计[start, end]内的素数个数，不生成素数列表"""
+    if end < 2 or start > end:
+        return 0
+    count = 1 if start <= 2 else 0
+    for _, _, segment in _segments(start, end, segment_size):
+        count += segment.count(1)
+    return count
+
+TRIAL_PRIMES = simple_sieve(1000)  # 分解质因数时先试除的小质数
+
+def spf_table(limit: int) -> array:
+    """最小质因子表：spf[n]为n的最小质因子（spf[0]=0，spf[1]=1）"""
+    spf = array('I', range(limit + 1))
+    # 从大到小处理质数，较小质数的赋值覆盖较大质数，最终保留最小质因子
+    for p in reversed(simple_sieve(math.isqrt(limit))):
+        spf[p * p::p] = array('I', [p]) * len(range(p * p, limit + 1, p))
+    return spf
+
+def factorize_with_spf(n: int, spf: array) -> List[int]:
+    """用最小质因子表分解n（n不超过表长），返回从小到大的质因数列表"""
+    factors = []
+    while n > 1:
+        p = spf[n]
+        factors.append(p)
+        n //= p
+    return factors
+
+def batch_factorize(numbers: Iterable[int]) -> Dict[int, List[int]]:
+    """批量分解一组正整数：只建一次最小质因子表"""
+    numbers = list(numbers)
+    if not numbers:
+        return {}
+    if min(numbers) <= 0:
+        raise ValueError("只能分解正整数！")
+    spf = spf_table(max(numbers))
+    return {n: factorize_with_spf(n, spf) for n in numbers}
+
+def is_prime(n: int) -> bool:
+    """Miller-Rabin素性检验，n < 3.3*10^24时结果是确定的"""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    # n - 1 = d * 2^s
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in SMALL_PRIMES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def pollard_rho(n: int) -> int:
+    """Pollard-rho（Brent改进）求n的一个非平凡因子，n须为合数"""
+    if n % 2 == 0:
+        return 2
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                # 累乘一批差值后再求一次gcd
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # 批量累乘越过了因子，逐步回退
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+def prime_factors(n: int) -> List[int]:
+    """分解质因数，返回从小到大的质因数列表（含重复）"""
+    if n <= 0:
+        raise ValueError("只能分解正整数！")
+    factors = []
+    # 先试除小质数
+    for p in TRIAL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    if n == 1:
+        return factors
+    stack = [n]
+    while stack:
+        m = stack.pop()
+        if m < 1000 * 1000 or is_prime(m):
+            # 剩下的数没有1000以内的因子，小于10^6时必为素数
+            factors.append(m)
+            continue
+        d = pollard_rho(m)
+        stack.extend((d, m // d))
+    return sorted(factors)
+
+def _sigma_chunk(low: int, high: int):
+    """[low, high)内每个数的真因子之和（low >= 1）"""
+    size = high - low
+    if np is not None:
+        sums = np.zeros(size, dtype=np.int64)
+        for d in range(1, math.isqrt(high - 1) + 1):
+            # 本块内d的倍数中不小于d*d的部分，配对因子为m // d
+            first = max(d * d, (low + d - 1) // d * d)
+            if first >= high:
+                continue
+            if first == d * d:
+                sums[first - low] += d
+                first += d
+            if first < high:
+                cofactors = np.arange(first // d, (high - 1) // d + 1, dtype=np.int64)
+                sums[first - low::d] += cofactors + d
+        sums -= np.arange(low, high, dtype=np.int64)  # 去掉自身
+        return sums
+
+    sums = [0] * size
+    for d in range(1, math.isqrt(high - 1) + 1):
+        first = max(d * d, (low + d - 1) // d * d)
+        if first == d * d and first < high:
+            sums[first - low] += d
+            first += d
+        for m in range(first, high, d):
+            sums[m - low] += d + m // d
+    return [total - m for m, total in zip(range(low, high), sums)]
+
+def divisor_sum_chunks(start: int, end: int,
+                       chunk_size: int = SIGMA_CHUNK_SIZE) -> Iterator[Tuple[int, object]]:
+    """逐块产出(块起点, 真因子和数组)，覆盖[start, end]，每块只占O(chunk_size)内存"""
+    low = max(start, 1)
+    while low <= end:
+        high = min(low + chunk_size, end + 1)
+        yield low, _sigma_chunk(low, high)
+        low = high
+
+def divisor_sums(start: int, end: int) -> List[int]:
+    """[start, end]内每个数的真因子之和"""
+    result = []
+    for _, sums in divisor_sum_chunks(start, end):
+        result.extend(sums.tolist() if np is not None else sums)
+    return result
+
+def classify_range(start: int, end: int) -> Tuple[int, int, int]:
+    """统计[start, end]内完数、盈数、亏数的个数"""
+    perfect = abundant = deficient = 0
+    for low, sums in divisor_sum_chunks(start, end):
+        if np is not None:
+            numbers = np.arange(low, low + len(sums), dtype=np.int64)
+            perfect += int(np.count_nonzero(sums == numbers))
+            abundant += int(np.count_nonzero(sums > numbers))
+            deficient += int(np.count_nonzero(sums < numbers))
+        else:
+            for m, total in zip(range(low, low + len(sums)), sums):
+                if total == m:
+                    perfect += 1
+                elif total > m:
+                    abundant += 1
+                else:
+                    deficient += 1
+    return perfect, abundant, deficient
+
+def lucas_lehmer(p: int) -> bool:
+    """Lucas-Lehmer检验：判断梅森数2^p - 1是否为素数（p为素数）"""
+    if p == 2:
+        return True
+    mersenne = (1 << p) - 1
+    s = 4
+    for _ in range(p - 2):
+        s = s * s - 2
+        # 利用2^p ≡ 1取模，只用移位和加法
+        s = (s & mersenne) + (s >> p)
+        if s >= mersenne:
+            s -= mersenne
+    return s == 0
+
+def perfect_numbers(start: int, end: int) -> List[int]:
+    """[start, end]内的所有完数
+
+    欧几里得-欧拉定理：偶完数都形如2^(p-1) * (2^p - 1)，其中2^p - 1为梅森素数；
+    10^1500以内不存在奇完数，超出该范围时无法保证结果完整
+    """
+    if end >= 10 ** 1500:
+        raise ValueError("超出已验证不存在奇完数的范围！")
+    result = []
+    p = 2
+    while True:
+        n = (1 << (p - 1)) * ((1 << p) - 1)
+        if n > end:
+            return result
+        if n >= start and is_prime(p) and lucas_lehmer(p):
+            result.append(n)
+        p += 1
+
+if __name__ == '__main__':
+    try:
+        while True:
+            print("\n请选择操作：")
+            print("1. 列出区间内的素数")
+            print("2. 统计区间内的素数个数")
+            print("3. 判断素数")
+            print("4. 分解质因数")
+            print("5. 统计完数、盈数、亏数")
+            print("6. 退出")
+
+            choice = input("请输入选择（1-6）：")
+
+            if choice in ('1', '2'):
+                start, end = map(int, input("请输入区间的起点和终点（空格分隔）：").split())
+                if choice == '1':
+                    primes = find_primes(start, end)
+                    print(f"\n共有 {len(primes)} 个素数：{primes}")
+                else:
+                    print(f"\n共有 {count_primes(start, end)} 个素数")
+
+            elif choice == '3':
+                n = int(input("请输入整数："))
+                print(f"\n{n} {'是' if is_prime(n) else '不是'}素数")
+
+            elif choice == '4':
+                n = int(input("请输入正整数："))
+                print(f"\n{n} = {'*'.join(map(str, prime_factors(n))) or '1'}")
+
+            elif choice == '5':
+                start, end = map(int, input("请输入区间的起点和终点（空格分隔）：").split())
+                perfect, abundant, deficient = classify_range(start, end)
+                print(f"\n完数 {perfect} 个，盈数 {abundant} 个，亏数 {deficient} 个")
+                print(f"完数：{perfect_numbers(start, end)}")
+
+            elif choice == '6':
+                break
+
+            else:
+                print("无效的选择！")
+
+    except ValueError as e:
+        print(f"错误：{str(e)}")
@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# -*- coding: UTF-8 -*-
+
+"""
+题目：大文件分块并行字符串匹配（供 078~084 单模式串匹配算法共用）。
+
+程序分析：
+1. 用 mmap 将文件映射到内存，避免一次性读入整个文件
+2. 将文件切分为若干块，相邻块重叠 len(pattern) - 1 个字节，保证跨块的匹配不会丢失
+3. 使用进程池并行扫描每个块，扫描算法可选 KMP、Sunday、Boyer-Moore、Horspool、
+   Shift-And、Shift-Or、Rabin-Karp
+4. 各算法以字节模式（search_bytes）直接扫描映射内存，不做解码
+5. 每个块只保留起点落在本块内的匹配，最后合并、去重并排序，返回字节偏移
+"""
+
+import importlib
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+# 算法名 -> (模块名, 类名)
+ALGORITHMS = {
+    'kmp': ('078_kmp', 'KMP'),
+    'sunday': ('079_sunday', 'Sunday'),
+    'boyer_moore': ('080_boyer_moore', 'BoyerMoore'),
+    'horspool': ('081_horspool', 'Horspool'),
+    'shift_and': ('082_shift_and', 'ShiftAnd'),
+    'shift_or': ('083_shift_or', 'ShiftOr'),
+    'rabin_karp': ('084_rabin_karp', 'RabinKarp'),
+}
+
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024  # 默认每块16MB
+
+def byte_view(data):
+    """把bytearray、memoryview、mmap等缓冲区对象转换为逐字节的memoryview
+
+    迭代mmap得到的是长度为1的bytes而不是整数，统一转换后迭代和下标都得到整数；
+    str、bytes原样返回，不支持缓冲区协议的可迭代对象也原样返回
+    """
+    if isinstance(data, (str, bytes)):
+        return data
+    try:
+        return memoryview(data).cast('B')
+    except TypeError:
+        return data
+
+def _load_matcher(algorithm: str):
+    """按算法名加载匹配器"""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"不支持的算法：{algorithm}")
+    # 序号开头的文件名不能直接 import，只能通过 importlib 加载
+    here = os.path.dirname(os.path.abspath(__file__))
+    if here not in sys.path:
+        sys.path.insert(0, here)
+    module_name, class_name = ALGORITHMS[algorithm]
+    return getattr(importlib.import_module(module_name), class_name)()
+
+def split_chunks(size: int, chunk_size: int, overlap: int) -> List[Tuple[int, int, int]]:
+    """切分文件，返回 (起点, 终点, 读取终点) 列表，读取终点 = 终点 + 重叠长度"""
+    if chunk_size <= 0:
+        raise ValueError("块大小必须为正数！")
+    chunks = []
+    for start in range(0, size, chunk_size):
+        end = min(start + chunk_size, size)
+        chunks.append((start, end, min(end + overlap, size)))
+    return chunks
+
+def _scan_chunk(args: Tuple[str, str, bytes, int, int, int]) -> List[int]:
+    """扫描一个块，返回起点落在 [start, end) 内的匹配的字节偏移"""
+    path, algorithm, pattern, start, end, read_end = args
+    matcher = _load_matcher(algorithm)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # 字节模式直接扫描映射内存的切片，不复制也不解码
+        with memoryview(mm) as view, view[start:read_end] as chunk:
+            positions = matcher.search_bytes(chunk, pattern)
+    return [start + pos for pos in positions if pos < end - start]
+
+def parallel_search(path: str, pattern: Union[str, bytes], algorithm: str = 'kmp',
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, workers: Optional[int] = None,
+                    encoding: str = 'utf-8') -> List[int]:
+    """在文件中并行搜索模式串，返回所有匹配的字节偏移（已排序、去重）"""
+    if isinstance(pattern, str):
+        pattern = pattern.encode(encoding)
+    if not pattern:
+        return []
+    _load_matcher(algorithm)  # 提前检查算法名
+
+    size = os.path.getsize(path)
+    if size < len(pattern):
+        return []
+
+    chunks = split_chunks(size, chunk_size, len(pattern) - 1)
+    tasks = [(path, algorithm, pattern, start, end, read_end)
+             for start, end, read_end in chunks]
+
+    if len(tasks) == 1 or workers == 1:
+        results = list(map(_scan_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_scan_chunk, tasks))
+
+    # 合并各块结果并去重
+    return sorted({pos for positions in results for pos in positions})
+
+if __name__ == '__main__':
+    try:
+        path = input("请输入文件路径：").strip()
+        if not os.path.isfile(path):
+            raise ValueError("文件不存在！")
+
+        pattern = input("请输入要搜索的模式串：").strip()
+        if not pattern:
+            raise ValueError("模式串不能为空！")
+
+        names = list(ALGORITHMS)
+        print("\n请选择算法：")
+        for i, name in enumerate(names, 1):
+            print(f"{i}. {name}")
+        choice = input(f"请输入选择（1-{len(names)}）：")
+        if not choice.isdigit() or not 1 <= int(choice) <= len(names):
+            raise ValueError("无效的选择！")
+
+        positions = parallel_search(path, pattern, names[int(choice) - 1])
+        if positions:
+            print(f"\n共找到 {len(positions)} 处匹配，字节偏移：")
+            for pos in positions:
+                print(f"位置 {pos}")
+        else:
+            print("未找到匹配！")
+
+    except ValueError as e:
+        print(f"错误：{str(e)}")
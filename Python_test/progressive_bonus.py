@@ -0,0 +1,149 @@
+#!/usr/bin/python
+# -*- coding: UTF-8 -*-
+
+"""
+题目：表驱动的分段累进提成计算（供 002、018 共用）。
+
+程序分析：
+1. 提成规则用两列表示：各档的起点 thresholds（从0开始递增）和各档提成比例 rates
+2. 预先算出每档起点处已累计的奖金 bases，任一利润只需定位所在档：
+   奖金 = bases[i] + (利润 - thresholds[i]) * rates[i]
+3. 单个利润用二分查找定位，一批利润用 np.searchsorted 一次定位，整列向量化计算
+4. 规则可从JSON配置文件读取：{"thresholds": [...], "rates": [...]}
+5. CSV文件按块流式读取，每块整列计算后追加奖金列写出，内存与文件大小无关
+"""
+
+import csv
+import json
+from bisect import bisect_left
+from typing import Iterable, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # 没有NumPy时逐个计算
+    np = None
+
+CSV_CHUNK_SIZE = 100000  # CSV每块处理的行数
+
+class BracketTable:
+    """分段累进提成表"""
+    def __init__(self, thresholds: Sequence[float], rates: Sequence[float]):
+        if len(thresholds) != len(rates) or not thresholds:
+            raise ValueError("档位起点与提成比例的数量必须相同且不能为空！")
+        if thresholds[0] != 0:
+            raise ValueError("第一档必须从0开始！")
+        if any(a >= b for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError("档位起点必须严格递增！")
+        self.thresholds = [float(t) for t in thresholds]
+        self.rates = [float(r) for r in rates]
+        # 每档起点处已累计的奖金
+        self.bases = [0.0]
+        for i in range(1, len(self.thresholds)):
+            width = self.thresholds[i] - self.thresholds[i - 1]
+            self.bases.append(self.bases[-1] + width * self.rates[i - 1])
+        if np is not None:
+            self._thresholds = np.array(self.thresholds)
+            self._rates = np.array(self.rates)
+            self._bases = np.array(self.bases)
+
+    @classmethod
+    def from_config(cls, path: str) -> 'BracketTable':
+        """从JSON配置文件读取提成规则"""
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+        try:
+            return cls(config['thresholds'], config['rates'])
+        except (KeyError, TypeError):
+            raise ValueError("配置文件必须包含 thresholds 和 rates！")
+
+    def bonus(self, profit: float) -> float:
+        """计算单个利润的奖金，利润不超过0时奖金为0"""
+        if profit <= 0:
+            return 0.0
+        # 利润落在(thresholds[i], thresholds[i+1]]时属于第i档
+        i = bisect_left(self.thresholds, profit) - 1
+        return self.bases[i] + (profit - self.thresholds[i]) * self.rates[i]
+
+    def bonus_array(self, profits: Iterable[float]):
+        """批量计算奖金：有NumPy时返回ndarray，否则返回列表"""
+        if np is None:
+            return [self.bonus(p) for p in profits]
+        profits = np.asarray(profits, dtype=np.float64)
+        index = np.maximum(np.searchsorted(self._thresholds, profits, side='left') - 1, 0)
+        bonus = self._bases[index] + (profits - self._thresholds[index]) * self._rates[index]
+        return np.where(profits > 0, bonus, 0.0)
+
+    def process_csv(self, src_path: str, dst_path: str, column: str = 'profit',
+                    chunk_size: int = CSV_CHUNK_SIZE, encoding: str = 'utf-8') -> int:
+        """流式读取CSV，按利润列追加 bonus 列写入新文件，返回处理的行数"""
+        total = 0
+        with open(src_path, newline='', encoding=encoding) as src, \
+             open(dst_path, 'w', newline='', encoding=encoding) as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            header = next(reader, None)
+            if header is None:
+                return 0
+            if column not in header:
+                raise ValueError(f"CSV中没有列：{column}")
+            col = header.index(column)
+            writer.writerow(header + ['bonus'])
+
+            rows: List[List[str]] = []
+            for row in reader:
+                rows.append(row)
+                if len(rows) >= chunk_size:
+                    total += self._write_chunk(writer, rows, col)
+                    rows = []
+            if rows:
+                total += self._write_chunk(writer, rows, col)
+        return total
+
+    def _write_chunk(self, writer, rows: List[List[str]], col: int) -> int:
+        """整块计算奖金并写出"""
+        try:
+            profits = [float(row[col]) for row in rows]
+        except (ValueError, IndexError):
+            raise ValueError("利润列包含无效的数字！")
+        bonuses = self.bonus_array(profits)
+        writer.writerows(row + [f"{b:.2f}"] for row, b in zip(rows, bonuses))
+        return len(rows)
+
+# 题目中的提成规则
+DEFAULT_TABLE = BracketTable(
+    thresholds=[0, 100000, 200000, 400000, 600000, 1000000],
+    rates=[0.1, 0.075, 0.05, 0.03, 0.015, 0.01],
+)
+
+if __name__ == '__main__':
+    try:
+        path = input("请输入提成规则配置文件路径（直接回车使用默认规则）：").strip()
+        table = BracketTable.from_config(path) if path else DEFAULT_TABLE
+
+        while True:
+            print("\n请选择操作：")
+            print("1. 计算单个利润的奖金")
+            print("2. 批量计算CSV文件")
+            print("3. 退出")
+
+            choice = input("请输入选择（1-3）：")
+
+            if choice == '1':
+                profit = float(input('请输入当月利润（元）：'))
+                print(f'应发放奖金：{table.bonus(profit):,.2f}元')
+
+            elif choice == '2':
+                src = input("请输入CSV文件路径：").strip()
+                dst = input("请输入输出文件路径：").strip()
+                column = input("请输入利润列名（直接回车为profit）：").strip() or 'profit'
+                count = table.process_csv(src, dst, column)
+                print(f"已处理 {count} 行，结果写入：{dst}")
+
+            elif choice == '3':
+                break
+
+            else:
+                print("无效的选择！")
+
+    except (ValueError, OSError) as e:
+        print(f"错误：{str(e)}")
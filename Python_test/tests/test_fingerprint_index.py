@@ -0,0 +1,34 @@
+# -*- coding: UTF-8 -*-
+"""084 文档指纹索引相似度的回归测试"""
+
+import importlib
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+rabin_karp = importlib.import_module('084_rabin_karp')
+
+def test_identical_repetitive_documents_score_one():
+    text = 'date,cases,deaths\n2020-01-01,1,0\n' * 200
+    index = rabin_karp.FingerprintIndex(k=20, window=10)
+    index.add_document('a', text)
+    index.add_document('b', text)
+    assert index.similar_pairs(threshold=0.8) == [('a', 'b', 1.0)]
+
+def test_common_fingerprints_excluded_from_both_sides():
+    header = 'id,name,value,comment\n'
+    index = rabin_karp.FingerprintIndex(k=8, window=4)
+    for i in range(5):
+        index.add_document(f'other{i}', header + f'unrelated row number {i} ' * 3)
+    body = 'the quick brown fox jumps over the lazy dog\n' * 3
+    index.add_document('x', header + body)
+    index.add_document('y', header + body)
+    pairs = index.similar_pairs(threshold=0.5, max_df=2)
+    assert pairs[0] == ('x', 'y', 1.0)
+
+def test_unrelated_documents_not_paired():
+    index = rabin_karp.FingerprintIndex(k=8, window=4)
+    index.add_document('a', 'abcdefghijklmnopqrstuvwxyz' * 3)
+    index.add_document('b', '0123456789' * 8)
+    assert index.similar_pairs(threshold=0.1) == []
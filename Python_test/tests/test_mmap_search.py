@@ -0,0 +1,38 @@
+# -*- coding: UTF-8 -*-
+"""字节模式匹配器直接扫描mmap的回归测试"""
+
+import importlib
+import mmap
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parallel_search import ALGORITHMS
+
+DATA = b'abracadabra, cadabra!\n' * 50
+PATTERN = b'cadabra'
+EXPECTED = [i for i in range(len(DATA)) if DATA.startswith(PATTERN, i)]
+
+@pytest.fixture
+def mapped(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(DATA)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
+
+@pytest.mark.parametrize('algorithm', sorted(ALGORITHMS))
+def test_search_bytes_on_mmap(mapped, algorithm):
+    module_name, class_name = ALGORITHMS[algorithm]
+    matcher = getattr(importlib.import_module(module_name), class_name)()
+    assert matcher.search_bytes(mapped, PATTERN) == EXPECTED
+
+def test_kmp_stream_on_mmap(mapped):
+    kmp = importlib.import_module('078_kmp')
+    stream = kmp.KMPStream(PATTERN)
+    chunks = (mapped[i:i + 37] for i in range(0, len(mapped), 37))
+    assert list(stream.feed_all(chunks)) == EXPECTED
+    stream.reset()
+    assert stream.feed(mapped) == EXPECTED
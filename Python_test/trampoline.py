@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# -*- coding: UTF-8 -*-
+
+"""
+题目：把递归函数改写为显式栈执行的蹦床（trampoline），供 022、023 等递归练习共用。
+
+程序分析：
+1. 递归函数写成生成器：递归调用处写 (yield f.call(参数))，表达式的值就是子调用的返回值
+2. 被 @trampoline 装饰后，由一个循环用列表保存挂起的生成器，调用深度不受解释器递归深度限制
+3. 函数返回 f.call(参数)（而不是 yield）表示尾调用：当前调用直接被替换，不占用栈空间
+4. 没有递归调用的分支可以直接 return，普通函数（不含 yield）同样适用
+"""
+
+from functools import wraps
+from types import GeneratorType
+
+class Call:
+    """一次待执行的调用"""
+    __slots__ = ('func', 'args', 'kwargs')
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+def _run(result):
+    """执行调用链：生成器压栈，子调用的返回值送回父生成器"""
+    stack = []
+    while True:
+        if isinstance(result, Call):
+            # 尾调用或子调用：直接执行，不增加栈深度
+            result = result.func(*result.args, **result.kwargs)
+            continue
+        if isinstance(result, GeneratorType):
+            stack.append(result)
+            gen, value = result, None
+        elif not stack:
+            return result
+        else:
+            gen, value = stack[-1], result
+        try:
+            request = gen.send(value)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+            continue
+        if not isinstance(request, Call):
+            raise TypeError("蹦床函数中只能 yield 递归调用（f.call(...)）！")
+        result = request
+
+def trampoline(func):
+    """装饰器：让以生成器形式书写的递归函数在显式栈上执行"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return _run(Call(func, args, kwargs))
+
+    wrapper.call = lambda *args, **kwargs: Call(func, args, kwargs)
+    return wrapper
+
+if __name__ == '__main__':
+    @trampoline
+    def count_down(n):
+        """非尾递归：返回n + (n-1) + ... + 1"""
+        if n == 0:
+            return 0
+        return n + (yield count_down.call(n - 1))
+
+    @trampoline
+    def count_down_tail(n, total=0):
+        """尾递归：同样的求和，不占用栈空间"""
+        if n == 0:
+            return total
+        return count_down_tail.call(n - 1, total + n)
+
+    try:
+        n = int(input("请输入递归深度："))
+        if n < 0:
+            raise ValueError("深度不能为负数！")
+        print(f"非尾递归结果：{count_down(n)}")
+        print(f"尾递归结果：{count_down_tail(n)}")
+    except ValueError as e:
+        print(f"错误：{str(e)}")
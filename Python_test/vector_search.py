@@ -0,0 +1,55 @@
+#!/usr/bin/python
+# -*- coding: UTF-8 -*-
+
+"""
+题目：NumPy沿文本方向向量化的多模式串精确匹配（供 082、083 的 search_blocks 共用）。
+
+程序分析：
+1. 文本和模式串都转为UTF-32码点数组，一次比较整列字符
+2. 第j轮计算“从该起点开始的前j+1个字符都匹配”的布尔数组，
+   相当于对所有起点同时求出Shift-And状态的第j位（Shift-Or为其取反）
+3. 存活的起点少于1/16时改为只检查这些起点的下一个字符，随机文本上很快收敛
+4. 每个模式串单独扫描，最坏情况（如全为同一字符的文本）为O(n·m)次向量化比较
+"""
+
+from typing import Dict, List
+
+try:
+    import numpy as np
+except ImportError:  # 没有NumPy时调用方退回Python大整数实现
+    np = None
+
+SPARSE_RATIO = 16  # 存活起点少于总数的1/16时改为只检查存活起点
+
+def _codes(text: str):
+    """字符串转为码点数组（保留代理字符）"""
+    return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+def column_search(text: str, patterns: List[str]) -> Dict[str, List[int]]:
+    """在文本中查找所有模式串，返回 模式串 -> 起始位置列表（只包含有匹配的模式串）"""
+    if np is None:
+        raise ValueError("需要安装NumPy！")
+    codes = _codes(text)
+    n = len(codes)
+    result = {}
+    for pattern in dict.fromkeys(p for p in patterns if p):
+        m = len(pattern)
+        if m > n:
+            continue
+        count = n - m + 1
+        targets = _codes(pattern)
+        alive = codes[:count] == targets[0]  # 第j位：从该起点开始的前j+1个字符都匹配
+        starts = None                         # 稀疏后改为存活起点的下标数组
+        for j in range(1, m):
+            if starts is None:
+                alive &= codes[j:j + count] == targets[j]
+                if np.count_nonzero(alive) * SPARSE_RATIO < count:
+                    starts = np.flatnonzero(alive)
+            else:
+                starts = starts[codes[starts + j] == targets[j]]
+            if starts is not None and not starts.size:
+                break
+        positions = (np.flatnonzero(alive) if starts is None else starts).tolist()
+        if positions:
+            result[pattern] = positions
+    return result